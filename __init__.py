@@ -29,7 +29,7 @@ def _init():
         
         logger, config = _log, _cfg
         
-        if token := config.get_access_token():
+        if token := config.get_access_token_cached():
             set_access_token(token)
         
         logger.info(f"AnkiPH v{ADDON_VERSION} ready")
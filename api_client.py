@@ -33,6 +33,7 @@ try:
         SYNC_TIMEOUT_SECONDS, DOWNLOAD_TIMEOUT_SECONDS,
         TARGET_REQUEST_DURATION_MIN, TARGET_REQUEST_DURATION_MAX,
         DEFAULT_MAX_RETRIES, MIN_TOKEN_LENGTH,
+        HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
         PREMIUM_URL
     )
 except ImportError:
@@ -48,6 +49,8 @@ except ImportError:
     TARGET_REQUEST_DURATION_MAX = 5.0
     DEFAULT_MAX_RETRIES = 3
     MIN_TOKEN_LENGTH = 20
+    HTTP_POOL_CONNECTIONS = 8
+    HTTP_POOL_MAXSIZE = 16
 
 # API Configuration
 API_VERSION = "4.0"
@@ -55,6 +58,7 @@ API_VERSION = "4.0"
 # HTTP Library Detection
 try:
     import requests  # type: ignore
+    import requests.adapters  # type: ignore
     _HAS_REQUESTS = True
 except ImportError:
     import urllib.request as _urllib_request
@@ -233,6 +237,8 @@ class ApiClient:
         self.base_url = base_url.rstrip("/")
         self._refresh_lock = threading.Lock()  # Thread-safe token refresh
         self._refresh_attempted = False  # Track if refresh was attempted this session
+        self._session = None  # Lazily created keep-alive session (requests only)
+        self._session_lock = threading.Lock()
 
     # ------------------------------------------------------------------------
     # Core HTTP Methods
@@ -479,6 +485,31 @@ class ApiClient:
         
         return data
 
+    def _get_session(self):
+        """
+        Shared requests.Session so calls reuse pooled keep-alive connections
+        instead of paying a TCP+TLS handshake each (requests only).
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=HTTP_POOL_CONNECTIONS,
+                        pool_maxsize=HTTP_POOL_MAXSIZE
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def stream_get(self, url: str, timeout: int):
+        """
+        Open a streaming GET for a file URL on the pooled session (requests only).
+        No auth headers are sent. Use the response as a context manager.
+        """
+        return self._get_session().get(url, timeout=timeout, stream=True)
+
     def _post_with_requests(
         self, 
         url: str, 
@@ -487,7 +518,7 @@ class ApiClient:
         timeout: int
     ) -> Any:
         """POST using requests library (preferred)"""
-        resp = requests.post(url, headers=headers, json=json_body or {}, timeout=timeout)
+        resp = self._get_session().post(url, headers=headers, json=json_body or {}, timeout=timeout)
         return self._parse_response(resp)
 
     def _post_with_urllib(
@@ -1416,7 +1447,7 @@ def ensure_valid_token() -> bool:
     Returns:
         True if we have a valid token (existing or refreshed)
     """
-    token = config.get_access_token()
+    token = config.get_access_token_cached()
     if not token:
         set_access_token(None)
         return False
@@ -10,8 +10,12 @@ Version: 4.0.0
 from aqt import mw
 from datetime import datetime
 import json
+import os
 import threading
 
+# Verbose console tracing for hot accessors, read once at import
+_DEBUG = bool(os.environ.get("ANKIPH_DEBUG"))
+
 
 class Config:
     """Manages addon configuration and authentication state"""
@@ -22,6 +26,10 @@ class Config:
         self._cache_timestamp = 0
         self._cache_timeout = 1.0  # 1 second cache
         self._cache_lock = threading.RLock()  # Thread safety (Reentrant)
+        self._downloaded_decks_cache = None
+        self._downloaded_decks_col = None  # Collection the cache was read from
+        self._access_token_cache = None
+        self._access_token_loaded = False  # Cache is dropped on every config write
         
     def _get_config(self):
         """Get the addon config from Anki with caching and thread safety"""
@@ -119,6 +127,7 @@ class Config:
             with self._cache_lock:
                 self._config_cache = None
                 self._cache_timestamp = 0
+                self._access_token_loaded = False
             
             return True
             
@@ -156,6 +165,9 @@ class Config:
             print(f"✗ Cannot save profile meta '{key}': no collection")
             return False
         
+        if key == 'downloaded_decks':
+            self._invalidate_downloaded_decks_cache()
+        
         try:
             meta_key = f"ankiph_{key}"
             mw.col.set_config(meta_key, value)
@@ -184,6 +196,19 @@ class Config:
         """Get the current access token"""
         return self._get_config().get('access_token')
     
+    def get_access_token_cached(self):
+        """
+        Get the current access token without copying the config.
+        
+        Any config write (save_tokens, set_access_token, clear_tokens,
+        including the clear on an auth error) drops the cached value.
+        """
+        with self._cache_lock:
+            if not self._access_token_loaded:
+                self._access_token_cache = self._get_config().get('access_token')
+                self._access_token_loaded = True
+            return self._access_token_cache
+    
     def get_refresh_token(self):
         """Get the current refresh token"""
         return self._get_config().get('refresh_token')
@@ -200,7 +225,7 @@ class Config:
     
     def is_logged_in(self):
         """Check if user is logged in with a valid token"""
-        token = self.get_access_token()
+        token = self.get_access_token_cached()
         return bool(token)
     
     def save_user_data(self, user_data: dict):
@@ -293,10 +318,7 @@ class Config:
     
     def is_lifetime_subscriber(self) -> bool:
         """Check if user has lifetime subscription (grandfathered or purchased)"""
-        if self._get_config().get('is_lifetime', False):
-            return True
-        tier = self.get_subscription_tier()
-        return tier == 'lifetime'
+        return self._is_lifetime(self._get_config())
     
     def has_active_subscription(self) -> bool:
         """
@@ -305,23 +327,7 @@ class Config:
         Returns:
             True if user has subscription AND it hasn't expired (or is lifetime)
         """
-        if not self.has_subscription():
-            return False
-        
-        # Lifetime subscribers never expire
-        if self.is_lifetime_subscriber():
-            return True
-        
-        expires_at = self.get_subscription_expires_at()
-        if not expires_at:
-            return False
-        
-        try:
-            expiry = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
-            return expiry > datetime.now(expiry.tzinfo)
-        except (ValueError, TypeError):
-            # If we can't parse the date, assume still valid
-            return True
+        return self._has_active_subscription(self._get_config())
     
     def has_full_access(self) -> bool:
         """
@@ -339,12 +345,54 @@ class Config:
         Returns:
             Status string like "Lifetime Subscriber" or "Free Tier - Limited Access"
         """
-        if self.is_lifetime_subscriber():
+        return self._access_status_text(self._get_config())
+    
+    def get_account_snapshot(self) -> dict:
+        """
+        Get the account fields shown in the UI from a single config read.
+        
+        Returns:
+            Dict with 'user', 'has_full_access' and 'status_text'
+        """
+        cfg = self._get_config()
+        return {
+            'user': cfg.get('user') or {},
+            'has_full_access': self._has_active_subscription(cfg),
+            'status_text': self._access_status_text(cfg),
+        }
+    
+    @staticmethod
+    def _is_lifetime(cfg) -> bool:
+        return bool(cfg.get('is_lifetime', False)) or cfg.get('subscription_tier', 'free') == 'lifetime'
+    
+    @classmethod
+    def _has_active_subscription(cls, cfg) -> bool:
+        if not cfg.get('has_subscription', False):
+            return False
+        
+        # Lifetime subscribers never expire
+        if cls._is_lifetime(cfg):
+            return True
+        
+        expires_at = cfg.get('subscription_expires_at')
+        if not expires_at:
+            return False
+        
+        try:
+            expiry = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+            return expiry > datetime.now(expiry.tzinfo)
+        except (ValueError, TypeError):
+            # If we can't parse the date, assume still valid
+            return True
+    
+    @classmethod
+    def _access_status_text(cls, cfg) -> str:
+        if cls._is_lifetime(cfg):
             return "Lifetime Subscriber - Full Access"
         
-        if self.has_active_subscription():
-            tier = self.get_subscription_tier()
-            expires = self.get_subscription_expires_at()
+        if cls._has_active_subscription(cfg):
+            tier = cfg.get('subscription_tier', 'free')
+            expires = cfg.get('subscription_expires_at')
             tier_label = tier.capitalize() if tier != 'free' else 'AnkiPH'
             
             if expires:
@@ -458,9 +506,34 @@ class Config:
             print(f"⚠ downloaded_decks is not a dict, resetting")
             decks = {}
         
-        print(f"Retrieved {len(decks)} tracked deck(s) for current profile")
+        if _DEBUG:
+            print(f"Retrieved {len(decks)} tracked deck(s) for current profile")
         return decks
     
+    def get_downloaded_decks_cached(self):
+        """
+        Get downloaded decks without re-reading profile metadata.
+        
+        The cache is dropped whenever downloaded_decks is written through this
+        class or the collection changes. Treat the result as read-only; use
+        get_downloaded_decks() for a copy you intend to modify.
+        """
+        if not mw.col:
+            return {}
+        
+        with self._cache_lock:
+            if self._downloaded_decks_cache is None or self._downloaded_decks_col is not mw.col:
+                decks = self._get_profile_meta('downloaded_decks', {})
+                self._downloaded_decks_cache = decks if isinstance(decks, dict) else {}
+                self._downloaded_decks_col = mw.col
+            return self._downloaded_decks_cache
+    
+    def _invalidate_downloaded_decks_cache(self):
+        """Drop the cached downloaded_decks mapping"""
+        with self._cache_lock:
+            self._downloaded_decks_cache = None
+            self._downloaded_decks_col = None
+    
     def is_deck_downloaded(self, deck_id):
         """Check if a deck is downloaded (PROFILE-SPECIFIC)"""
         if not deck_id:
@@ -597,6 +670,14 @@ class Config:
         updates = self.get_available_updates()
         return str(deck_id) in updates and updates[str(deck_id)].get('has_update', False)
     
+    def get_decks_with_updates(self):
+        """Get the ids of all decks with an update available, in one config read"""
+        updates = self.get_available_updates()
+        return frozenset(
+            deck_id for deck_id, info in updates.items()
+            if info.get('has_update', False)
+        )
+    
     def clear_update_for_deck(self, deck_id):
         """Clear update notification for a specific deck"""
         cfg = self._get_config()
@@ -609,6 +690,19 @@ class Config:
         
         return True
     
+    def clear_updates_for_decks(self, deck_ids):
+        """Clear update notifications for several decks with one config write"""
+        cfg = self._get_config()
+        updates = cfg.get('available_updates', {})
+        
+        cleared = {str(d) for d in deck_ids}
+        remaining = {k: v for k, v in updates.items() if k not in cleared}
+        if len(remaining) == len(updates):
+            return True
+        
+        cfg['available_updates'] = remaining
+        return self._save_config(cfg)
+    
     # === NOTIFICATION TRACKING (GLOBAL) ===
     
     def get_last_notification_check(self):
@@ -69,6 +69,14 @@ TARGET_REQUEST_DURATION_MAX: Final[float] = 5.0  # Slow down if slower
 # Retry Behavior
 DEFAULT_MAX_RETRIES: Final[int] = 3  # Maximum retry attempts
 
+# Concurrency
+AUTO_UPDATE_MAX_WORKERS: Final[int] = 8  # Parallel deck downloads during auto-update
+MEDIA_DOWNLOAD_MAX_WORKERS: Final[int] = 8  # Parallel media fetches during deck import
+
+# HTTP Connection Pooling (shared requests.Session)
+HTTP_POOL_CONNECTIONS: Final[int] = 8   # Distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE: Final[int] = 16      # Keep-alive connections per host
+
 # =============================================================================
 # SECURITY
 # =============================================================================
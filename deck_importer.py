@@ -5,6 +5,9 @@ Version: 4.0.0 - Fixed GUID search and error handling
 """
 
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
 
 # HTTP Library Detection (matches api_client.py)
@@ -18,6 +21,7 @@ from aqt import mw
 from aqt.operations import QueryOp
 from aqt.utils import showInfo
 from anki.notes import Note
+from .api_client import api
 from .logger import logger
 from .utils import escape_anki_search
 
@@ -127,9 +131,32 @@ def _sync_note_types(note_types: List[Dict]):
         # For now, we assume if it exists, it's compatible, or we might miss field updates.
         # Future improvement: Compare fields and add missing ones.
 
+def _fetch_media(url: str, path: str) -> bool:
+    """
+    Stream one media file to path (runs on a worker thread).
+    The body is copied in chunks, never held in memory whole.
+    Returns False on an HTTP error status.
+    """
+    from .constants import DOWNLOAD_TIMEOUT_SECONDS
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if _HAS_REQUESTS:
+        # Pooled session keeps connections to the media host alive across files
+        with api.stream_get(url, DOWNLOAD_TIMEOUT_SECONDS) as r:
+            if r.status_code != 200:
+                return False
+            with open(path, 'wb') as f:
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+        return True
+    # Fallback to urllib
+    with _urllib_request.urlopen(url, timeout=DOWNLOAD_TIMEOUT_SECONDS) as resp, open(path, 'wb') as f:
+        shutil.copyfileobj(resp, f, 1 << 20)
+    return True
+
 def _sync_media_files(media_files: Any):
     """Download missing media files"""
-    from .constants import DOWNLOAD_TIMEOUT_SECONDS
+    from .constants import MEDIA_DOWNLOAD_MAX_WORKERS
     
     # Handle list of dicts or dict of filename:url
     if isinstance(media_files, dict):
@@ -141,25 +168,33 @@ def _sync_media_files(media_files: Any):
             if isinstance(m, dict) and 'filename' in m and 'url' in m:
                 items.append((m['filename'], m['url']))
                 
-    for filename, url in items:
-        # Check if exists
-        if os.path.exists(os.path.join(mw.col.media.dir(), filename)):
-            continue
-            
-        try:
-            # Download
+    # Only files that are missing locally and have an http(s) URL
+    media_dir = mw.col.media.dir()
+    missing = [
+        (filename, url) for filename, url in items
+        if not os.path.exists(os.path.join(media_dir, filename))
+        and hasattr(url, 'startswith') and url.startswith('http')
+    ]
+    if not missing:
+        return
+    
+    # Fetch concurrently into a scratch dir; each file is added to the
+    # collection on this thread as it lands (add_file keeps the base name)
+    with tempfile.TemporaryDirectory(prefix="ankiph-media-") as tmp_dir, \
+            ThreadPoolExecutor(max_workers=min(MEDIA_DOWNLOAD_MAX_WORKERS, len(missing))) as executor:
+        futures = {}
+        for i, (filename, url) in enumerate(missing):
             logger.debug(f"Downloading media: {filename}")
-            if hasattr(url, 'startswith') and url.startswith('http'):
-                if _HAS_REQUESTS:
-                    r = requests.get(url, timeout=DOWNLOAD_TIMEOUT_SECONDS)
-                    if r.status_code == 200:
-                        mw.col.media.write_data(filename, r.content)
-                else:
-                    # Fallback to urllib
-                    with _urllib_request.urlopen(url, timeout=DOWNLOAD_TIMEOUT_SECONDS) as resp:
-                        mw.col.media.write_data(filename, resp.read())
-        except Exception as e:
-            logger.warning(f"Failed to download media {filename}: {e}")
+            path = os.path.join(tmp_dir, str(i), os.path.basename(filename))
+            futures[executor.submit(_fetch_media, url, path)] = (filename, path)
+        
+        for future in as_completed(futures):
+            filename, path = futures.pop(future)
+            try:
+                if future.result():
+                    mw.col.media.add_file(path)
+            except Exception as e:
+                logger.warning(f"Failed to download media {filename}: {e}")
 
 def _process_card(card_data: Dict, deck_id: int) -> bool:
     """
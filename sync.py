@@ -6,7 +6,7 @@ Version: 4.0.0
 """
 
 from aqt import mw
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from .api_client import api, AnkiPHAPIError, set_access_token
 from .config import config
 from .deck_importer import get_deck_stats, deck_exists
@@ -208,11 +208,11 @@ def calculate_current_streak(deck_id: int) -> int:
         sorted_dates = sorted(list(review_dates), reverse=True)
         review_dates = sorted_dates
         
-        # Parse dates
+        # Parse dates (SQLite DATE() always yields ISO YYYY-MM-DD)
         parsed_dates = []
         for date_str in review_dates:
             try:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                parsed_date = date.fromisoformat(date_str)
                 parsed_dates.append(parsed_date)
             except ValueError as e:
                 logger.warning(f"Error parsing date '{date_str}': {e}")
@@ -403,41 +403,58 @@ def clean_deleted_backend_decks():
     if not downloaded_decks:
         return 0
     
+    try:
+        decks_to_remove = find_deleted_backend_decks(downloaded_decks.keys())
+        return remove_deleted_backend_decks(decks_to_remove)
+    
+    except Exception as e:
+        logger.error(f"Backend deck cleanup check failed (non-critical): {e}")
+        return 0
+
+
+def find_deleted_backend_decks(tracked_deck_ids) -> set:
+    """
+    Get the tracked deck IDs the server no longer lists.
+    Only makes the network call, so it can run off the GUI thread.
+    
+    Raises:
+        Exception: If the server request fails
+    """
     # Set access token
-    token = config.get_access_token()
+    token = config.get_access_token_cached()
     if not token:
-        return 0
+        return set()
     
     set_access_token(token)
     
-    try:
-        # Get user's subscriptions from server
-        result = api.browse_decks(category="subscribed")
-        
-        if not result.get('success') and 'decks' not in result:
-            logger.warning("Could not verify decks with server")
-            return 0
-        
-        server_decks = result.get('decks', [])
-        server_deck_ids = {deck.get('id') for deck in server_decks}
-        
-        # Find decks in local config that no longer exist on server
-        decks_to_remove = []
-        for deck_id in downloaded_decks.keys():
-            if deck_id not in server_deck_ids:
-                logger.warning(f"Deck {deck_id} not found on server, marking for cleanup")
-                decks_to_remove.append(deck_id)
-        
-        # Remove stale entries
-        for deck_id in decks_to_remove:
-            config.remove_downloaded_deck(deck_id)
-            logger.info(f"Removed server-deleted deck {deck_id} from local config")
-        
-        return len(decks_to_remove)
+    # Get user's subscriptions from server
+    result = api.browse_decks(category="subscribed")
     
-    except Exception as e:
-        logger.error(f"Backend deck cleanup check failed (non-critical): {e}")
-        return 0
+    if not result.get('success') and 'decks' not in result:
+        logger.warning("Could not verify decks with server")
+        return set()
+    
+    server_decks = result.get('decks', [])
+    server_deck_ids = {deck.get('id') for deck in server_decks}
+    
+    # Find decks in local config that no longer exist on server (set difference)
+    decks_to_remove = set(tracked_deck_ids) - server_deck_ids
+    for deck_id in decks_to_remove:
+        logger.warning(f"Deck {deck_id} not found on server, marking for cleanup")
+    return decks_to_remove
+
+
+def remove_deleted_backend_decks(deck_ids) -> int:
+    """
+    Stop tracking decks found by find_deleted_backend_decks (main thread).
+    
+    Returns:
+        Number of decks removed
+    """
+    for deck_id in deck_ids:
+        config.remove_downloaded_deck(deck_id)
+        logger.info(f"Removed server-deleted deck {deck_id} from local config")
+    return len(deck_ids)
 
 
 def sync_progress():
@@ -454,7 +471,7 @@ def sync_progress():
         raise Exception("Not logged in. Please login first.")
     
     # FIXED: Set access token BEFORE making API calls
-    token = config.get_access_token()
+    token = config.get_access_token_cached()
     if not token:
         raise Exception("No access token found. Please login again.")
     
@@ -576,7 +593,7 @@ def sync_deck_progress(deck_id: str) -> dict:
         raise Exception("Not logged in. Please login first.")
     
     # Set access token
-    token = config.get_access_token()
+    token = config.get_access_token_cached()
     if not token:
         raise Exception("No access token found. Please login again.")
     
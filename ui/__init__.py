@@ -3,11 +3,15 @@
 from .styles import COLORS, DARK_THEME, apply_dark_theme, get_button_style
 from .components import (
     ClickableLabel, StatusBar, DeckListWidget, DeckListItem,
-    ActionButton, EmptyStateWidget, CardWidget
+    ActionButton, EmptyStateWidget, CardWidget, TextListModel,
+    SubstringFilterProxy, batched_updates, LazyTabsMixin,
+    CloseAwareMixin
 )
 
 __all__ = [
     'COLORS', 'DARK_THEME', 'apply_dark_theme', 'get_button_style',
     'ClickableLabel', 'StatusBar', 'DeckListWidget', 'DeckListItem',
-    'ActionButton', 'EmptyStateWidget', 'CardWidget'
+    'ActionButton', 'EmptyStateWidget', 'CardWidget', 'TextListModel',
+    'SubstringFilterProxy', 'batched_updates', 'LazyTabsMixin',
+    'CloseAwareMixin'
 ]
\ No newline at end of file
@@ -11,10 +11,16 @@ from aqt.qt import (
     QTextEdit
 )
 from aqt import mw
+import re
 
 from ..api_client import api, set_access_token, AnkiPHAPIError
 from ..config import config
 from .styles import COLORS, apply_dark_theme
+from ..logger import logger
+
+
+# [sound:x] and src="x" media references in a field, compiled once
+_MEDIA_REF_RE = re.compile(r'\[sound:([^\]]+)\]|src=["\']([^"\']+)["\']')
 
 
 class AdvancedSyncDialog(QDialog):
@@ -343,23 +349,21 @@ class AdvancedSyncDialog(QDialog):
                 except:
                     continue
             
-            # Display tags
-            for tag in sorted(local_tags):
-                item = QListWidgetItem(f"🏷️ {tag}")
-                self.tags_preview.addItem(item)
+            # Display tags (one insert for the whole list)
+            self.tags_preview.addItems([f"🏷️ {tag}" for tag in sorted(local_tags)])
             
             self.status_label.setText(f"✓ Found {len(local_tags)} tags")
             
         except Exception as e:
             self.status_label.setText("❌ Failed to load tags")
-            print(f"Error loading tags: {e}")
+            logger.error(f"Error loading tags: {e}")
     
     def sync_tags(self):
         """Sync tags with server"""
         if self.sync_in_progress:
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
@@ -444,7 +448,7 @@ class AdvancedSyncDialog(QDialog):
         if self.sync_in_progress:
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
@@ -508,15 +512,14 @@ class AdvancedSyncDialog(QDialog):
             card_ids = mw.col.decks.cids(int(anki_deck_id), children=True)
             
             media_refs = set()
-            import re
-            media_pattern = re.compile(r'\[sound:([^\]]+)\]|src=["\']([^"\']+)["\']')
+            findall = _MEDIA_REF_RE.findall
             
             for cid in card_ids[:100]:  # Sample
                 try:
                     card = mw.col.get_card(cid)
                     note = card.note()
                     for field in note.fields:
-                        matches = media_pattern.findall(field)
+                        matches = findall(field)
                         for match in matches:
                             ref = match[0] or match[1]
                             if ref:
@@ -537,7 +540,7 @@ class AdvancedSyncDialog(QDialog):
         if self.sync_in_progress:
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
@@ -611,12 +614,10 @@ class AdvancedSyncDialog(QDialog):
                 except:
                     continue
             
-            for nt in sorted(note_types):
-                item = QListWidgetItem(f"📝 {nt}")
-                self.note_types_list.addItem(item)
+            self.note_types_list.addItems([f"📝 {nt}" for nt in sorted(note_types)])
                 
         except Exception as e:
-            print(f"Error loading note types: {e}")
+            logger.error(f"Error loading note types: {e}")
     
     def sync_note_types(self):
         """Sync note types with server"""
@@ -635,7 +636,7 @@ class AdvancedSyncDialog(QDialog):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
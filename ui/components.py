@@ -3,16 +3,77 @@ Reusable UI Components for AnkiPH Addon
 Version: 4.0.0
 """
 
+from contextlib import contextmanager
+
 from aqt.qt import (
     pyqtSignal,
     QLabel, QFrame, QHBoxLayout, QVBoxLayout, 
     QProgressBar, QListWidget, QListWidgetItem, 
-    QPushButton, QWidget, Qt
+    QPushButton, QWidget, Qt,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+    QBrush, QColor
 )
 
 from .styles import COLORS, get_button_style
 
 
+@contextmanager
+def batched_updates(widget):
+    """Suspend repaints, sorting and signals while a list widget is repopulated"""
+    sorting = getattr(widget, 'isSortingEnabled', lambda: False)()
+    if sorting:
+        widget.setSortingEnabled(False)
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
+        if sorting:
+            widget.setSortingEnabled(True)
+        widget.viewport().update()
+
+
+class LazyTabsMixin:
+    """
+    Dialog mixin for tabs whose widgets are built the first time they are shown.
+    
+    The dialog adds _create_tab_container() pages to self.tabs, maps their
+    indexes to builder callables in self._tab_builders, and connects
+    tabs.currentChanged to _ensure_tab_built.
+    """
+    
+    def _create_tab_container(self):
+        """Empty tab page that a lazily built tab is added to"""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return container
+    
+    def _ensure_tab_built(self, index):
+        """Build a lazily created tab's widgets on first use"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            self.tabs.widget(index).layout().addWidget(builder())
+
+
+class CloseAwareMixin:
+    """
+    Dialog mixin that records when the dialog is dismissed.
+    
+    Background task callbacks check self._closed first and drop results
+    that arrive after the dialog has gone away.
+    """
+    
+    _closed = False  # Set once the dialog is dismissed
+    
+    def done(self, result):
+        """Mark the dialog closed so late background results are dropped"""
+        self._closed = True
+        super().done(result)
+
+
 class ClickableLabel(QLabel):
     """Label that emits clicked signal"""
     clicked = pyqtSignal()
@@ -29,6 +90,18 @@ class ClickableLabel(QLabel):
 class StatusBar(QFrame):
     """Consistent status bar widget"""
     
+    # Finished per-state label sheets, built once rather than per set_status()
+    _LABEL_QSS = {
+        key: f"color: {COLORS[key]}; font-size: 12px;"
+        for key in ("info", "success", "warning", "error", "text_muted")
+    }
+    _BAR_QSS = f"""
+            StatusBar {{
+                background-color: {COLORS['bg_primary']};
+                border-top: 1px solid {COLORS['border']};
+            }}
+        """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
@@ -38,7 +111,8 @@ class StatusBar(QFrame):
         layout.setContentsMargins(10, 8, 10, 8)
         
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 12px;")
+        self.status_label.setStyleSheet(self._LABEL_QSS['text_muted'])
+        self._status_type = 'text_muted'
         layout.addWidget(self.status_label)
         
         layout.addStretch()
@@ -48,17 +122,16 @@ class StatusBar(QFrame):
         self.progress.setVisible(False)
         layout.addWidget(self.progress)
         
-        self.setStyleSheet(f"""
-            StatusBar {{
-                background-color: {COLORS['bg_primary']};
-                border-top: 1px solid {COLORS['border']};
-            }}
-        """)
+        self.setStyleSheet(self._BAR_QSS)
     
     def set_status(self, text: str, status_type: str = "info"):
         """Set status text with optional type (info, success, warning, error)"""
-        color = COLORS.get(status_type, COLORS['text_muted'])
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 12px;")
+        if status_type not in self._LABEL_QSS:
+            status_type = 'text_muted'
+        # Re-setting a stylesheet re-polishes the label, so only do it on change
+        if status_type != self._status_type:
+            self._status_type = status_type
+            self.status_label.setStyleSheet(self._LABEL_QSS[status_type])
         self.status_label.setText(text)
     
     def show_progress(self, value: int = -1, maximum: int = 100):
@@ -125,6 +198,104 @@ class DeckListWidget(QListWidget):
         self.clear()
 
 
+class TextListModel(QAbstractListModel):
+    """
+    Lightweight list model for QListView.
+    
+    Rows are (text, data) or (text, data, tooltip) tuples. Qt only asks for
+    the rows it paints, so no per-row widget objects are created. An optional
+    foreground color applies to every row. Set search_data=False when the
+    data element is a structured payload that filtering should not match.
+    """
+    
+    def __init__(self, rows=None, parent=None, foreground=None, search_data=True):
+        super().__init__(parent)
+        # Views only honour a QBrush/QColor here, not a bare Qt.GlobalColor
+        self._foreground = QBrush(QColor(foreground)) if foreground is not None else None
+        self._search_data = search_data
+        self._rows = list(rows or [])
+        self._keys = [self._make_key(r) for r in self._rows]
+    
+    def _make_key(self, row):
+        """Lowercased search key over text (and data), computed once per row"""
+        if not self._search_data:
+            return row[0].lower()
+        return f"{row[0]}\x00{row[1]}".lower()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[0]
+        if role == Qt.ItemDataRole.UserRole:
+            return row[1]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return row[2] if len(row) > 2 else None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground
+        return None
+    
+    def filter_key(self, row: int) -> str:
+        """Get the precomputed lowercased search key for a row"""
+        return self._keys[row]
+    
+    def row_data(self):
+        """Get the data element of every row, in order"""
+        return [r[1] for r in self._rows]
+    
+    def set_rows(self, rows):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._keys = [self._make_key(r) for r in self._rows]
+        self.endResetModel()
+    
+    def append_rows(self, rows):
+        """Append rows at the end without resetting the view"""
+        rows = list(rows)
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._keys.extend(self._make_key(r) for r in rows)
+        self.endInsertRows()
+    
+    def remove_at(self, row: int):
+        """Remove a single row; the view only updates around that row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._keys[row]
+        self.endRemoveRows()
+    
+    def clear(self):
+        """Remove all rows"""
+        self.set_rows([])
+
+
+class SubstringFilterProxy(QSortFilterProxyModel):
+    """Case-insensitive substring filter over TextListModel's precomputed keys"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+    
+    def set_query(self, text: str):
+        """Set the filter text; lowercased once per call, not per row"""
+        query = text.lower()
+        if query == self._query:
+            return
+        self._query = query
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._query in self.sourceModel().filter_key(source_row)
+
+
 class ActionButton(QPushButton):
     """Styled action button"""
     
@@ -150,6 +321,8 @@ class ActionButton(QPushButton):
 class EmptyStateWidget(QWidget):
     """Widget shown when a list is empty"""
     
+    _MESSAGE_QSS = f"color: {COLORS['text_muted']}; font-size: 14px; padding: 20px;"
+    
     def __init__(self, message: str, action_text: str = "", parent=None):
         super().__init__(parent)
         self.action_button = None
@@ -161,7 +334,7 @@ class EmptyStateWidget(QWidget):
         
         message_label = QLabel(message)
         message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 14px; padding: 20px;")
+        message_label.setStyleSheet(self._MESSAGE_QSS)
         message_label.setWordWrap(True)
         layout.addWidget(message_label)
         
@@ -173,16 +346,19 @@ class EmptyStateWidget(QWidget):
 class CardWidget(QFrame):
     """Card-style container widget"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet(f"""
+    _CARD_QSS = f"""
             CardWidget {{
                 background-color: {COLORS['bg_tertiary']};
                 border: 1px solid {COLORS['border']};
                 border-radius: 8px;
                 padding: 16px;
             }}
-        """)
+        """
+    _TITLE_QSS = f"color: {COLORS['text_primary']}; font-size: 16px; font-weight: bold;"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet(self._CARD_QSS)
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(16, 16, 16, 16)
         self.main_layout.setSpacing(12)
@@ -190,7 +366,7 @@ class CardWidget(QFrame):
     def add_title(self, text: str):
         """Add a title to the card"""
         title = QLabel(text)
-        title.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 16px; font-weight: bold;")
+        title.setStyleSheet(self._TITLE_QSS)
         self.main_layout.insertWidget(0, title)
     
     def add_content(self, widget: QWidget):
@@ -11,13 +11,17 @@ from aqt.qt import (
     QTableWidget, QTableWidgetItem, QHeaderView
 )
 from aqt import mw
+from datetime import datetime
 
 from ..api_client import api, set_access_token, AnkiPHAPIError
 from ..config import config
+from ..utils import strip_html
 from .styles import COLORS, apply_dark_theme
+from .components import batched_updates, CloseAwareMixin
+from ..logger import logger
 
 
-class CardHistoryDialog(QDialog):
+class CardHistoryDialog(CloseAwareMixin, QDialog):
     """Dialog for viewing card history and rollback"""
     
     def __init__(self, deck_id: str, card_guid: str, deck_name: str = "", parent=None):
@@ -78,7 +82,7 @@ class CardHistoryDialog(QDialog):
         
         self.changes_list = QListWidget()
         self.changes_list.setMaximumHeight(120)
-        self.changes_list.setStyleSheet("QListWidget::item { padding: 5px; }")
+        self.changes_list.setProperty("class", "compact")
         details_layout.addWidget(self.changes_list)
         
         # Content preview
@@ -124,14 +128,14 @@ class CardHistoryDialog(QDialog):
         # Bottom buttons
         button_layout = QHBoxLayout()
         
-        refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.load_history)
-        button_layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("🔄 Refresh")
+        self.refresh_btn.clicked.connect(self.load_history)
+        button_layout.addWidget(self.refresh_btn)
         
-        rollback_btn = QPushButton("⏪ Rollback to Selected Version")
-        rollback_btn.setStyleSheet("padding: 8px; font-weight: bold; background-color: #ff9800; color: white;")
-        rollback_btn.clicked.connect(self.rollback_to_selected)
-        button_layout.addWidget(rollback_btn)
+        self.rollback_btn = QPushButton("⏪ Rollback to Selected Version")
+        self.rollback_btn.setStyleSheet("padding: 8px; font-weight: bold; background-color: #ff9800; color: white;")
+        self.rollback_btn.clicked.connect(self.rollback_to_selected)
+        button_layout.addWidget(self.rollback_btn)
         
         button_layout.addStretch()
         
@@ -145,20 +149,33 @@ class CardHistoryDialog(QDialog):
     
     def load_history(self):
         """Load card history from server"""
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             self.status_label.setText("❌ Not logged in")
             return
         
         set_access_token(token)
         self.status_label.setText("⏳ Loading history...")
+        self.refresh_btn.setEnabled(False)
         
-        try:
-            result = api.get_card_history(
+        # Network round-trip runs off the GUI thread; result handled on main
+        def _fetch():
+            return api.get_card_history(
                 deck_id=self.deck_id,
                 card_guid=self.card_guid,
                 limit=50
             )
+        
+        mw.taskman.run_in_background(_fetch, self._on_history_loaded)
+    
+    def _on_history_loaded(self, future):
+        """Populate the timeline from the get_card_history result (runs on the main thread)"""
+        if self._closed:
+            return
+        self.refresh_btn.setEnabled(True)
+        
+        try:
+            result = future.result()
             
             if not result.get('success'):
                 self.status_label.setText("❌ Failed to load history")
@@ -168,6 +185,7 @@ class CardHistoryDialog(QDialog):
             
             # Populate table
             self.history_table.setRowCount(len(self.history))
+            date_cache = {}  # changed_at -> formatted date; entries often share one
             
             for i, entry in enumerate(self.history):
                 version = entry.get('version', 'Unknown')
@@ -175,14 +193,16 @@ class CardHistoryDialog(QDialog):
                 changed_by = entry.get('changed_by', 'Unknown')
                 
                 # Format date
-                date_str = changed_at
-                if changed_at and changed_at != 'Unknown':
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(changed_at.replace('Z', '+00:00'))
-                        date_str = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        pass
+                date_str = date_cache.get(changed_at)
+                if date_str is None:
+                    date_str = changed_at
+                    if changed_at and changed_at != 'Unknown':
+                        try:
+                            iso = changed_at[:-1] + '+00:00' if changed_at.endswith('Z') else changed_at
+                            date_str = datetime.fromisoformat(iso).strftime("%Y-%m-%d %H:%M")
+                        except:
+                            pass
+                    date_cache[changed_at] = date_str
                 
                 # Get summary
                 changes = entry.get('changes', {})
@@ -208,7 +228,7 @@ class CardHistoryDialog(QDialog):
         
         except Exception as e:
             self.status_label.setText("❌ Error loading history")
-            print(f"Error loading card history: {e}")
+            logger.error(f"Error loading card history: {e}")
     
     def on_version_selected(self):
         """Handle version selection"""
@@ -271,20 +291,34 @@ class CardHistoryDialog(QDialog):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
         
         set_access_token(token)
         self.status_label.setText("⏳ Rolling back...")
+        self.rollback_btn.setEnabled(False)
         
-        try:
-            result = api.rollback_card(
+        def _rollback():
+            return api.rollback_card(
                 deck_id=self.deck_id,
                 card_guid=self.card_guid,
                 target_version=str(version)
             )
+        
+        mw.taskman.run_in_background(
+            _rollback, lambda future: self._on_rollback_done(future, version)
+        )
+    
+    def _on_rollback_done(self, future, version):
+        """Handle the rollback_card result (runs on the main thread)"""
+        if self._closed:
+            return
+        self.rollback_btn.setEnabled(True)
+        
+        try:
+            result = future.result()
             
             if result.get('success'):
                 self.status_label.setText(f"✓ Rolled back to version {version}")
@@ -344,7 +378,7 @@ class DeckHistoryBrowser(QDialog):
         
         # Card list
         self.cards_list = QListWidget()
-        self.cards_list.setStyleSheet("QListWidget::item { padding: 10px; }")
+        self.cards_list.setProperty("class", "roomy")
         self.cards_list.itemDoubleClicked.connect(self.view_card_history)
         layout.addWidget(self.cards_list)
         
@@ -393,32 +427,33 @@ class DeckHistoryBrowser(QDialog):
             
             # Limit to first 100 cards for performance
             display_count = min(len(card_ids), 100)
+            errors = []
+            
+            with batched_updates(self.cards_list):
+                for cid in card_ids[:display_count]:
+                    try:
+                        card = mw.col.get_card(cid)
+                        note = card.note()
+                        
+                        # Get first field content for display (read it once)
+                        raw = note.fields[0] if note.fields else ""
+                        first_field = strip_html(raw[:50])
+                        
+                        guid = note.guid
+                        
+                        display_text = f"📄 {first_field}{'...' if len(raw) > 50 else ''}"
+                        
+                        item = QListWidgetItem(display_text)
+                        item.setData(Qt.ItemDataRole.UserRole, guid)
+                        item.setToolTip(f"GUID: {guid}")
+                        self.cards_list.addItem(item)
+                        
+                    except Exception as e:
+                        errors.append((cid, e))
+                        continue
             
-            for cid in card_ids[:display_count]:
-                try:
-                    card = mw.col.get_card(cid)
-                    note = card.note()
-                    
-                    # Get first field content for display
-                    first_field = ""
-                    if note.fields:
-                        first_field = note.fields[0][:50]
-                        # Strip HTML
-                        import re
-                        first_field = re.sub(r'<[^>]+>', '', first_field)
-                    
-                    guid = note.guid
-                    
-                    display_text = f"📄 {first_field}{'...' if len(note.fields[0]) > 50 else ''}"
-                    
-                    item = QListWidgetItem(display_text)
-                    item.setData(Qt.ItemDataRole.UserRole, guid)
-                    item.setToolTip(f"GUID: {guid}")
-                    self.cards_list.addItem(item)
-                    
-                except Exception as e:
-                    print(f"Error loading card {cid}: {e}")
-                    continue
+            if errors:
+                logger.warning(f"load_cards: {len(errors)} cards failed, first: {errors[0]}")
             
             if len(card_ids) > display_count:
                 self.status_label.setText(f"Showing {display_count} of {len(card_ids)} cards")
@@ -427,7 +462,7 @@ class DeckHistoryBrowser(QDialog):
         
         except Exception as e:
             self.status_label.setText("❌ Failed to load cards")
-            print(f"Error loading cards: {e}")
+            logger.error(f"Error loading cards: {e}")
     
     def view_card_history(self, item=None):
         """Open history dialog for selected card"""
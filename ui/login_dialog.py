@@ -5,6 +5,7 @@ Version: 4.0.0
 """
 
 import webbrowser
+from functools import partial
 from aqt.qt import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, Qt, QFrame
@@ -135,7 +136,7 @@ class LoginDialog(QDialog):
         
         register_link = ClickableLabel("Register now")
         register_link.setObjectName("linkLabel")
-        register_link.clicked.connect(lambda: webbrowser.open(REGISTER_URL))
+        register_link.clicked.connect(partial(webbrowser.open, REGISTER_URL))
         register_layout.addWidget(register_link)
         
         main_layout.addLayout(register_layout)
@@ -147,7 +148,7 @@ class LoginDialog(QDialog):
         
         forgot_link = ClickableLabel("Forgot password?")
         forgot_link.setObjectName("linkLabel")
-        forgot_link.clicked.connect(lambda: webbrowser.open(FORGOT_PASSWORD_URL))
+        forgot_link.clicked.connect(partial(webbrowser.open, FORGOT_PASSWORD_URL))
         forgot_layout.addWidget(forgot_link)
         
         main_layout.addLayout(forgot_layout)
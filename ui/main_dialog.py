@@ -8,7 +8,8 @@ import webbrowser
 from aqt.qt import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QListWidget, QListWidgetItem, QMessageBox, Qt,
-    QWidget, QSplitter, QFrame, QCheckBox, QSizePolicy, QApplication, QTimer
+    QWidget, QSplitter, QFrame, QCheckBox, QSizePolicy, QApplication, QTimer,
+    QListView
 )
 from aqt import mw
 from aqt.utils import showInfo, tooltip
@@ -19,6 +20,7 @@ from ..deck_importer import import_deck_from_json
 from ..utils import escape_anki_search
 from ..update_checker import update_checker
 from .styles import COLORS, apply_dark_theme
+from .components import TextListModel, SubstringFilterProxy, batched_updates, CloseAwareMixin
 from ..logger import logger
 from ..constants import (
     HOMEPAGE_URL, TERMS_URL, PRIVACY_URL,
@@ -27,7 +29,225 @@ from ..constants import (
 )
 
 
-class AnkiPHMainDialog(QDialog):
+# Deck-dict accessors, bound as locals inside hot loops.
+# Server payloads use either 'deck_id' or 'id' for the deck UUID.
+def _deck_id(d, _g=dict.get):
+    return _g(d, 'deck_id') or _g(d, 'id')
+
+
+# Deck list row prefixes (installed / not installed)
+_PFX_INSTALLED = "â— "
+_PFX_MISSING = "â—‹ "
+
+
+# Main dialog stylesheet, built once at import
+_MAIN_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {COLORS["bg_primary"]};
+        color: {COLORS["text_primary"]};
+    }}
+    
+    #actionBar {{
+        background-color: {COLORS["bg_tertiary"]};
+        border-bottom: 1px solid {COLORS["border"]};
+    }}
+    
+    #primaryBtn {{
+        background-color: {COLORS["btn_primary"]};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 24px;
+        font-weight: bold;
+        font-size: 13px;
+    }}
+    #primaryBtn:hover {{
+        background-color: {COLORS["btn_primary_hover"]};
+    }}
+    
+    #secondaryBtn {{
+        background-color: transparent;
+        color: {COLORS["text_secondary"]};
+        border: 1px solid {COLORS["border"]};
+        border-radius: 6px;
+        padding: 10px 24px;
+        font-size: 13px;
+    }}
+    #secondaryBtn:hover {{
+        border-color: {COLORS["text_muted"]};
+        color: {COLORS["text_primary"]};
+    }}
+    
+    #leftPanel {{
+        background-color: {COLORS["bg_primary"]};
+        border-right: 1px solid {COLORS["border"]};
+    }}
+    
+    #panelHeader {{
+        background-color: {COLORS["bg_tertiary"]};
+        color: {COLORS["text_primary"]};
+        font-weight: bold;
+        font-size: 12px;
+        padding: 12px 15px;
+        border-bottom: 1px solid {COLORS["border"]};
+    }}
+    
+    #deckList {{
+        background-color: {COLORS["bg_primary"]};
+        border: none;
+        color: {COLORS["text_primary"]};
+        font-size: 13px;
+    }}
+    #deckList::item {{
+        padding: 12px 15px;
+        border-bottom: 1px solid {COLORS["bg_secondary"]};
+        border-radius: 4px;
+        margin: 2px 4px;
+    }}
+    #deckList::item:selected {{
+        background-color: {COLORS["bg_selected"]};
+        color: white;
+    }}
+    #deckList::item:hover:!selected {{
+        background-color: {COLORS["bg_hover"]};
+    }}
+    
+    #rightPanel {{
+        background-color: {COLORS["bg_primary"]};
+    }}
+    
+    #detailTitle {{
+        color: {COLORS["btn_primary"]};
+        font-size: 18px;
+        font-weight: bold;
+    }}
+    
+    #outlineBtn {{
+        background-color: transparent;
+        color: {COLORS["text_secondary"]};
+        border: 1px solid {COLORS["border"]};
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 12px;
+    }}
+    #outlineBtn:hover {{
+        border-color: {COLORS["text_muted"]};
+        color: {COLORS["text_primary"]};
+    }}
+    #outlineBtn:disabled {{
+        color: {COLORS["border"]};
+        border-color: {COLORS["bg_tertiary"]};
+    }}
+    
+    #dangerOutlineBtn {{
+        background-color: transparent;
+        color: {COLORS["error"]};
+        border: 1px solid {COLORS["error"]};
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 12px;
+    }}
+    #dangerOutlineBtn:hover {{
+        background-color: {COLORS["error"]};
+        color: white;
+    }}
+    #dangerOutlineBtn:disabled {{
+        color: {COLORS["border"]};
+        border-color: {COLORS["bg_tertiary"]};
+    }}
+    
+    #separator {{
+        color: {COLORS["border"]};
+    }}
+    
+    #sectionHeader {{
+        color: {COLORS["text_primary"]};
+        font-weight: bold;
+        font-size: 13px;
+        margin-top: 5px;
+    }}
+    
+    #installStatus {{
+        color: {COLORS["warning"]};
+        font-size: 12px;
+    }}
+    #installStatus[state="missing"] {{
+        color: #ffa726;
+    }}
+    #installStatus[state="update"] {{
+        color: {COLORS["btn_primary"]};
+    }}
+    #installStatus[state="current"] {{
+        color: {COLORS["success"]};
+    }}
+    
+    #syncBtn {{
+        background-color: {COLORS["btn_primary"]};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-size: 13px;
+        font-weight: bold;
+    }}
+    #syncBtn:hover {{
+        background-color: {COLORS["btn_primary_hover"]};
+    }}
+    
+    #infoLabel {{
+        color: {COLORS["text_muted"]};
+        font-size: 12px;
+    }}
+    
+    #statusBar {{
+        background-color: {COLORS["bg_tertiary"]};
+        border-top: 1px solid {COLORS["border"]};
+        max-height: 44px;
+    }}
+    
+    #statusText {{
+        color: {COLORS["text_muted"]};
+        font-size: 11px;
+    }}
+    
+    #subscriptionBadge, #freeBadge {{
+        color: white;
+        padding: 3px 10px;
+        border-radius: 10px;
+        font-size: 10px;
+        font-weight: bold;
+        max-height: 20px;
+        min-height: 16px;
+    }}
+    #subscriptionBadge {{
+        background-color: {COLORS["success"]};
+    }}
+    #freeBadge {{
+        background-color: {COLORS["warning"]};
+    }}
+    
+    #linkBtn {{
+        background: transparent;
+        border: none;
+        color: {COLORS["text_link"]};
+        font-size: 12px;
+        padding: 5px 10px;
+    }}
+    #linkBtn:hover {{
+        color: {COLORS["btn_primary_hover"]};
+    }}
+    
+    QSplitter::handle {{
+        background-color: {COLORS["border"]};
+        width: 1px;
+    }}
+    QSplitter::handle:hover {{
+        background-color: {COLORS["text_muted"]};
+    }}
+"""
+
+
+class AnkiPHMainDialog(CloseAwareMixin, QDialog):
     """AnkiHub-style two-panel deck management dialog"""
     
     def __init__(self, parent=None):
@@ -36,10 +256,32 @@ class AnkiPHMainDialog(QDialog):
         self.setMinimumSize(700, 500)
         self.resize(800, 550)
         self.selected_deck = None
+        self._details_key = None  # Inputs of the currently shown deck details
         self.all_decks = []  # Store deck data for filtering
+        # Per-row deck fields, parallel lists indexed by the item's UserRole
+        self._row_ids = []
+        self._row_infos = []
+        self._row_names = []
+        self._row_installed = []
+        self._row_updates = []
+        self._decks_dirty = False  # Deck list is stale; reload when next shown
         self.setup_ui()
         self.apply_styles()
     
+    def showEvent(self, event):
+        """Reload a deck list that went stale while the dialog was hidden"""
+        super().showEvent(event)
+        if self._decks_dirty:
+            self.refresh_decks()
+    
+    def refresh_decks(self):
+        """Reload the deck list now if visible, otherwise on the next show"""
+        if not self.isVisible():
+            self._decks_dirty = True
+            return
+        self._decks_dirty = False
+        self.load_decks()
+    
     def setup_ui(self):
         """Setup the two-panel UI"""
         layout = QVBoxLayout()
@@ -83,6 +325,7 @@ class AnkiPHMainDialog(QDialog):
     
     def _finish_rebuild(self):
         """Finish rebuilding the UI after cleanup"""
+        self._details_key = None
         self.setup_ui()
         self.apply_styles()
     
@@ -164,10 +407,13 @@ class AnkiPHMainDialog(QDialog):
         self.deck_list.setObjectName("deckList")
         self.deck_list.itemClicked.connect(self.on_deck_selected)
         layout.addWidget(self.deck_list)
-        
-        # Load decks
-        self.load_decks()
-        
+
+        # Placeholder now, load once the event loop has painted the panel
+        placeholder = QListWidgetItem("Loading decks...")
+        placeholder.setFlags(placeholder.flags() & ~Qt.ItemFlag.ItemIsSelectable)
+        self.deck_list.addItem(placeholder)
+        QTimer.singleShot(0, self.load_decks)
+
         return panel
     
     def _create_details_panel(self):
@@ -252,17 +498,18 @@ class AnkiPHMainDialog(QDialog):
         layout = QHBoxLayout(bar)
         layout.setContentsMargins(15, 10, 15, 10)
         
+        # One config read for everything the bar shows
+        account = config.get_account_snapshot()
+        
         # User info
-        user = config.get_user()
-        email = user.get('email', 'Unknown') if user else 'Unknown'
+        email = account['user'].get('email', 'Unknown')
         user_label = QLabel(f"Logged in as: {email}")
         user_label.setObjectName("statusText")
         layout.addWidget(user_label)
         
         # Subscription status
-        status = config.get_access_status_text()
-        status_label = QLabel(status)
-        status_label.setObjectName("subscriptionBadge" if config.has_full_access() else "freeBadge")
+        status_label = QLabel(account['status_text'])
+        status_label.setObjectName("subscriptionBadge" if account['has_full_access'] else "freeBadge")
         layout.addWidget(status_label)
         
         layout.addStretch()
@@ -283,207 +530,12 @@ class AnkiPHMainDialog(QDialog):
     
     def apply_styles(self):
         """Apply dark theme styles using shared COLORS"""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS["bg_primary"]};
-                color: {COLORS["text_primary"]};
-            }}
-            
-            #actionBar {{
-                background-color: {COLORS["bg_tertiary"]};
-                border-bottom: 1px solid {COLORS["border"]};
-            }}
-            
-            #primaryBtn {{
-                background-color: {COLORS["btn_primary"]};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-weight: bold;
-                font-size: 13px;
-            }}
-            #primaryBtn:hover {{
-                background-color: {COLORS["btn_primary_hover"]};
-            }}
-            
-            #secondaryBtn {{
-                background-color: transparent;
-                color: {COLORS["text_secondary"]};
-                border: 1px solid {COLORS["border"]};
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-size: 13px;
-            }}
-            #secondaryBtn:hover {{
-                border-color: {COLORS["text_muted"]};
-                color: {COLORS["text_primary"]};
-            }}
-            
-            #leftPanel {{
-                background-color: {COLORS["bg_primary"]};
-                border-right: 1px solid {COLORS["border"]};
-            }}
-            
-            #panelHeader {{
-                background-color: {COLORS["bg_tertiary"]};
-                color: {COLORS["text_primary"]};
-                font-weight: bold;
-                font-size: 12px;
-                padding: 12px 15px;
-                border-bottom: 1px solid {COLORS["border"]};
-            }}
-            
-            #deckList {{
-                background-color: {COLORS["bg_primary"]};
-                border: none;
-                color: {COLORS["text_primary"]};
-                font-size: 13px;
-            }}
-            #deckList::item {{
-                padding: 12px 15px;
-                border-bottom: 1px solid {COLORS["bg_secondary"]};
-                border-radius: 4px;
-                margin: 2px 4px;
-            }}
-            #deckList::item:selected {{
-                background-color: {COLORS["bg_selected"]};
-                color: white;
-            }}
-            #deckList::item:hover:!selected {{
-                background-color: {COLORS["bg_hover"]};
-            }}
-            
-            #rightPanel {{
-                background-color: {COLORS["bg_primary"]};
-            }}
-            
-            #detailTitle {{
-                color: {COLORS["btn_primary"]};
-                font-size: 18px;
-                font-weight: bold;
-            }}
-            
-            #outlineBtn {{
-                background-color: transparent;
-                color: {COLORS["text_secondary"]};
-                border: 1px solid {COLORS["border"]};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }}
-            #outlineBtn:hover {{
-                border-color: {COLORS["text_muted"]};
-                color: {COLORS["text_primary"]};
-            }}
-            #outlineBtn:disabled {{
-                color: {COLORS["border"]};
-                border-color: {COLORS["bg_tertiary"]};
-            }}
-            
-            #dangerOutlineBtn {{
-                background-color: transparent;
-                color: {COLORS["error"]};
-                border: 1px solid {COLORS["error"]};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }}
-            #dangerOutlineBtn:hover {{
-                background-color: {COLORS["error"]};
-                color: white;
-            }}
-            #dangerOutlineBtn:disabled {{
-                color: {COLORS["border"]};
-                border-color: {COLORS["bg_tertiary"]};
-            }}
-            
-            #separator {{
-                color: {COLORS["border"]};
-            }}
-            
-            #sectionHeader {{
-                color: {COLORS["text_primary"]};
-                font-weight: bold;
-                font-size: 13px;
-                margin-top: 5px;
-            }}
-            
-            #installStatus {{
-                color: {COLORS["warning"]};
-                font-size: 12px;
-            }}
-            
-            #syncBtn {{
-                background-color: {COLORS["btn_primary"]};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            #syncBtn:hover {{
-                background-color: {COLORS["btn_primary_hover"]};
-            }}
-            
-            #infoLabel {{
-                color: {COLORS["text_muted"]};
-                font-size: 12px;
-            }}
-            
-            #statusBar {{
-                background-color: {COLORS["bg_tertiary"]};
-                border-top: 1px solid {COLORS["border"]};
-                max-height: 44px;
-            }}
-            
-            #statusText {{
-                color: {COLORS["text_muted"]};
-                font-size: 11px;
-            }}
-            
-            #subscriptionBadge {{
-                background-color: {COLORS["success"]};
-                color: white;
-                padding: 3px 10px;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-                max-height: 20px;
-                min-height: 16px;
-            }}
-            
-            #freeBadge {{
-                background-color: {COLORS["warning"]};
-                color: white;
-                padding: 3px 10px;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-                max-height: 20px;
-                min-height: 16px;
-            }}
-            
-            #linkBtn {{
-                background: transparent;
-                border: none;
-                color: {COLORS["text_link"]};
-                font-size: 12px;
-                padding: 5px 10px;
-            }}
-            #linkBtn:hover {{
-                color: {COLORS["btn_primary_hover"]};
-            }}
-            
-            QSplitter::handle {{
-                background-color: {COLORS["border"]};
-                width: 1px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {COLORS["text_muted"]};
-            }}
-        """)
+        # Re-setting an identical sheet still re-polishes every child widget;
+        # widgets added by a rebuild pick up the existing sheet on their own
+        if getattr(self, '_applied_qss', None) is _MAIN_DIALOG_QSS:
+            return
+        self.setStyleSheet(_MAIN_DIALOG_QSS)
+        self._applied_qss = _MAIN_DIALOG_QSS
 
     
     # === DATA LOADING ===
@@ -491,10 +543,15 @@ class AnkiPHMainDialog(QDialog):
     def load_decks(self):
         """Load subscribed decks - sync with server first, then show list"""
         self.deck_list.clear()
+        row_ids = self._row_ids = []
+        row_infos = self._row_infos = []
+        row_names = self._row_names = []
+        row_installed = self._row_installed = []
+        row_updates = self._row_updates = []
         
         try:
             # DEBUG: PHASE 1 - Isolate Network Sync
-            logger.info("DEBUG: Entering load_decks (Network Sync DISABLED)")
+            logger.debug("Entering load_decks (network sync disabled)")
             # self._sync_subscriptions_from_server()
             
             downloaded_decks = config.get_downloaded_decks()
@@ -505,67 +562,54 @@ class AnkiPHMainDialog(QDialog):
                 self.deck_list.addItem(item)
                 return
             
-            # Import deck_exists helper
-            from ..deck_importer import deck_exists
-            
-            # Batch check for installed decks to avoid N+1 queries
-            all_anki_ids = []
-            for d_info in downloaded_decks.values():
-                aid = d_info.get('anki_deck_id')
-                if aid:
-                    try:
-                        all_anki_ids.append(int(aid))
-                    except (ValueError, TypeError):
-                        pass
-            
             # PHASE 2: Isolate Collection Access
+            # One query for all local deck ids; installed checks below are set lookups
             existing_deck_ids = set()
             try:
                 if mw.col:
-                    logger.info("DEBUG: Accessing mw.col.decks")
+                    logger.debug("Accessing mw.col.decks")
                     all_decks_in_col = mw.col.decks.all_names_and_ids()
                     existing_deck_ids = {d.id for d in all_decks_in_col}
-                    logger.info(f"DEBUG: Found {len(existing_deck_ids)} local decks")
+                    logger.debug("Found %d local decks", len(existing_deck_ids))
             except Exception as coll_err:
                 logger.error(f"DEBUG: HIDDEN ERROR in collection access: {coll_err}")
                 # Don't fail the whole load if collection access fails
             
-            logger.info("DEBUG: Entering item loop - PRE-LOOP")
-            if not downloaded_decks:
-                logger.info("DEBUG: downloaded_decks is empty")
-            else:
-                logger.info(f"DEBUG: downloaded_decks has {len(downloaded_decks)} keys")
+            logger.debug("downloaded_decks has %d keys", len(downloaded_decks))
+            
+            # One config read for every row's update flag
+            pending_updates = config.get_decks_with_updates()
 
-            for deck_id, deck_info in downloaded_decks.items():
-                logger.info(f"DEBUG: Iterating deck {deck_id}")
-                # Get deck name - prefer server title, fallback to Anki deck name
-                anki_deck_id = deck_info.get('anki_deck_id')
-                server_title = deck_info.get('title')
-                deck_name = server_title or f"Deck {deck_id[:8]}"
-                is_installed = False
-                
-                if anki_deck_id:
-                    try:
-                        aid_int = int(anki_deck_id)
-                        is_installed = aid_int in existing_deck_ids
-                        
-                        if is_installed and not server_title and mw.col:
-                            deck = mw.col.decks.get(aid_int)
-                            if deck and deck['name'] != 'Default':
-                                deck_name = deck['name']
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Show install status in list (use bullet for not installed)
-                prefix = "â— " if is_installed else "â—‹ "
-                item = QListWidgetItem(f"{prefix}{deck_name}")
-                item.setData(Qt.ItemDataRole.UserRole, {
-                    'deck_id': deck_id,
-                    'info': deck_info,
-                    'name': deck_name,
-                    'is_installed': is_installed
-                })
-                self.deck_list.addItem(item)
+            with batched_updates(self.deck_list):
+                for deck_id, deck_info in downloaded_decks.items():
+                    # Get deck name - prefer server title, fallback to Anki deck name
+                    anki_deck_id = deck_info.get('anki_deck_id')
+                    server_title = deck_info.get('title')
+                    deck_name = server_title or f"Deck {deck_id[:8]}"
+                    is_installed = False
+                    
+                    if anki_deck_id:
+                        try:
+                            aid_int = int(anki_deck_id)
+                            is_installed = aid_int in existing_deck_ids
+                            
+                            if is_installed and not server_title and mw.col:
+                                deck = mw.col.decks.get(aid_int)
+                                if deck and deck['name'] != 'Default':
+                                    deck_name = deck['name']
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    # Show install status in list (use bullet for not installed)
+                    prefix = _PFX_INSTALLED if is_installed else _PFX_MISSING
+                    item = QListWidgetItem(prefix + deck_name)
+                    item.setData(Qt.ItemDataRole.UserRole, len(row_ids))
+                    row_ids.append(deck_id)
+                    row_infos.append(deck_info)
+                    row_names.append(deck_name)
+                    row_installed.append(is_installed)
+                    row_updates.append(deck_id in pending_updates)
+                    self.deck_list.addItem(item)
         
         except Exception as e:
             logger.exception(f"Error loading decks: {e}")
@@ -576,8 +620,8 @@ class AnkiPHMainDialog(QDialog):
             return
         
         try:
-            logger.info("DEBUG: Starting _sync_subscriptions_from_server")
-            token = config.get_access_token()
+            logger.debug("Starting _sync_subscriptions_from_server")
+            token = config.get_access_token_cached()
             if token:
                 set_access_token(token)
             
@@ -586,11 +630,12 @@ class AnkiPHMainDialog(QDialog):
             if result.get('success') or 'decks' in result:
                 server_decks = result.get('decks', [])
                 local_decks = config.get_downloaded_decks()
-                server_deck_ids = {d.get('id') for d in server_decks}
+                gid = _deck_id
+                server_deck_ids = {gid(d) for d in server_decks}
                 
                 # Add new subscriptions from server
                 for deck in server_decks:
-                    deck_id = deck.get('id')
+                    deck_id = gid(deck)
                     if deck_id and deck_id not in local_decks:
                         # New subscription from web - add to local config
                         config.save_downloaded_deck(
@@ -602,23 +647,40 @@ class AnkiPHMainDialog(QDialog):
                         )
                         logger.info(f"Synced subscription: {deck.get('title')}")
                 
-                # Remove local entries not on server anymore
-                for deck_id in list(local_decks.keys()):
-                    if deck_id not in server_deck_ids:
-                        config.remove_downloaded_deck(deck_id)
-                        logger.info(f"Removed unsubscribed deck: {deck_id}")
+                # Remove local entries not on server anymore (set difference)
+                for deck_id in local_decks.keys() - server_deck_ids:
+                    config.remove_downloaded_deck(deck_id)
+                    logger.info(f"Removed unsubscribed deck: {deck_id}")
         
         except Exception as e:
             logger.warning(f"Subscription sync failed (non-critical): {e}")
     
     def on_deck_selected(self, item):
         """Handle deck selection - show details in right panel"""
-        data = item.data(Qt.ItemDataRole.UserRole)
-        if not data:
+        row = item.data(Qt.ItemDataRole.UserRole)
+        if row is None:
             return
         
-        self.selected_deck = data
-        deck_info = data.get('info', {})
+        # Use pre-computed install/update status from load_decks
+        deck_info = self._row_infos[row]
+        is_installed = self._row_installed[row]
+        has_update = self._row_updates[row]
+        data = self.selected_deck = {
+            'deck_id': self._row_ids[row],
+            'info': deck_info,
+            'name': self._row_names[row],
+            'is_installed': is_installed,
+        }
+        
+        # Re-clicking the shown deck: nothing changed, skip the widget updates
+        details_key = (
+            data.get('deck_id'), data.get('name'), is_installed, has_update,
+            deck_info.get('version'), deck_info.get('card_count'),
+            deck_info.get('downloaded_at')
+        )
+        if details_key == self._details_key:
+            return
+        self._details_key = details_key
         
         # Update title
         self.detail_title.setText(data.get('name', 'Unknown Deck'))
@@ -627,25 +689,20 @@ class AnkiPHMainDialog(QDialog):
         self.open_web_btn.setEnabled(True)
         self.unsubscribe_btn.setEnabled(True)
         
-        # Use pre-computed install status from load_decks
-        is_installed = data.get('is_installed', False)
-        
         # Update install status
-        has_update = config.has_update_available(data.get('deck_id', ''))
-        
         if not is_installed:
             self.install_status.setText("âš  This deck is not installed yet!")
-            self.install_status.setStyleSheet("color: #ffa726;")
+            self._set_install_state("missing")
             self.sync_btn.setText("ðŸ”„ Sync to Install")
             self.sync_btn.setVisible(True)
         elif has_update:
             self.install_status.setText("â¬† Update available!")
-            self.install_status.setStyleSheet("color: #4a90d9;")
+            self._set_install_state("update")
             self.sync_btn.setText("ðŸ”„ Sync Update")
             self.sync_btn.setVisible(True)
         else:
             self.install_status.setText("âœ“ Installed and up to date")
-            self.install_status.setStyleSheet("color: #4CAF50;")
+            self._set_install_state("current")
             self.sync_btn.setVisible(False)
         
         # Show info
@@ -655,13 +712,24 @@ class AnkiPHMainDialog(QDialog):
         self.updated_label.setText(f"Downloaded: {deck_info.get('downloaded_at', 'Unknown')[:10] if deck_info.get('downloaded_at') else 'Not downloaded'}")
         self.info_container.setVisible(True)
     
+    def _set_install_state(self, state):
+        """Restyle only the install status label for missing/update/current"""
+        label = self.install_status
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+        label.update()
+    
     # === ACTIONS ===
     
     def browse_decks(self):
         """Open deck browser dialog"""
         dialog = DeckBrowserDialog(self)
         if dialog.exec():
-            self.load_decks()
+            self.refresh_decks()
     
     def create_deck(self):
         """Create a new collaborative deck"""
@@ -696,23 +764,33 @@ class AnkiPHMainDialog(QDialog):
         self.setCursor(Qt.CursorShape.WaitCursor)
         self.sync_btn.setEnabled(False)
         self.sync_btn.setText("Syncing...")
-        QApplication.processEvents()
         
+        token = config.get_access_token_cached()
+        if token:
+            set_access_token(token)
+        
+        # Get deck data (JSON) off the GUI thread; import happens back on main
+        mw.taskman.run_in_background(
+            lambda: api.download_deck(deck_id),
+            lambda future: self._on_install_downloaded(future, deck_id, deck_name)
+        )
+    
+    def _on_install_downloaded(self, future, deck_id, deck_name):
+        """
+        Import a downloaded deck (runs on the main thread).
+        The import always runs; widget updates are skipped once the dialog is closed.
+        """
         try:
-            token = config.get_access_token()
-            if token:
-                set_access_token(token)
-            
-            # Get deck data (JSON)
-            result = api.download_deck(deck_id)
+            result = future.result()
             print(f"âœ“ download_deck response: success={result.get('success')}")
             
             if not result.get('success'):
                 raise Exception(result.get('error', 'Sync failed'))
             
             # Use unified JSON import
-            self.sync_btn.setText("Importing data...")
-            QApplication.processEvents()
+            if not self._closed:
+                self.sync_btn.setText("Importing data...")
+                QApplication.processEvents()
             
             anki_deck_id = import_deck_from_json(result, deck_name)
             
@@ -725,17 +803,23 @@ class AnkiPHMainDialog(QDialog):
                     card_count=len(result.get('cards', []))
                 )
                 tooltip(f"âœ“ {deck_name} synced!")
-                self.load_decks()
+                if not self._closed:
+                    self.refresh_decks()
             else:
                 raise Exception("Import returned invalid deck ID")
                 
         except Exception as e:
             logger.error(f"Install error: {e}")
-            QMessageBox.critical(self, "Error", f"Install failed: {e}")
+            if self._closed:
+                showInfo(f"Install of {deck_name} failed: {e}", parent=mw)
+            else:
+                QMessageBox.critical(self, "Error", f"Install failed: {e}")
         finally:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.sync_btn.setEnabled(True)
-            self.sync_btn.setText("Sync")
+            if not self._closed:
+                self.setCursor(Qt.CursorShape.ArrowCursor)
+                self.sync_btn.setEnabled(True)
+                self.sync_btn.setText("Sync")
+                self._details_key = None  # Button text changed; re-render on next click
     
     def _install_from_pull_changes(self, deck_id, deck_info):
         """Install deck using v3.0 pull_changes flow with pagination"""
@@ -784,7 +868,7 @@ class AnkiPHMainDialog(QDialog):
                     self._save_last_change_id(deck_id, last_change_id)
                 
                 tooltip(f"âœ“ {deck_info.get('title', 'Deck')} installed! ({len(cards)} cards)")
-                self.load_decks()
+                self.refresh_decks()
             else:
                 raise Exception("Failed to build deck in Anki")
         
@@ -970,13 +1054,14 @@ class AnkiPHMainDialog(QDialog):
             deck_id = self.selected_deck.get('deck_id')
             config.remove_downloaded_deck(deck_id)
             self.selected_deck = None
+            self._details_key = None
             self.detail_title.setText("Select a deck")
             self.open_web_btn.setEnabled(False)
             self.unsubscribe_btn.setEnabled(False)
             self.install_status.setText("")
             self.sync_btn.setVisible(False)
             self.info_container.setVisible(False)
-            self.load_decks()
+            self.refresh_decks()
             tooltip("Deck unsubscribed")
     
     def show_login(self):
@@ -1011,13 +1096,20 @@ class AnkiPHMainDialog(QDialog):
 
 # === HELPER DIALOGS ===
 
-class DeckBrowserDialog(QDialog):
+_SUBSCRIBE_BTN_QSS = (
+    f"background-color: {COLORS['btn_primary']}; color: white; padding: 10px 20px; "
+    "border: none; border-radius: 6px; font-weight: bold;"
+)
+
+
+class DeckBrowserDialog(CloseAwareMixin, QDialog):
     """Browse available decks to subscribe"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Browse Decks")
         self.setMinimumSize(500, 400)
+        self._fetch_pending = False  # A browse_decks request is in flight
         self.setup_ui()
         apply_dark_theme(self)
     
@@ -1027,12 +1119,23 @@ class DeckBrowserDialog(QDialog):
         # Search
         self.search = QLineEdit()
         self.search.setPlaceholderText("Search decks...")
-        self.search.textChanged.connect(self.filter_decks)
+        
+        # Debounce: restart on each keystroke, filter once typing pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_decks)
+        self.search.textChanged.connect(lambda _text: self._filter_timer.start())
         layout.addWidget(self.search)
         
-        # List
-        self.deck_list = QListWidget()
-        self.deck_list.itemDoubleClicked.connect(self.subscribe_selected)
+        # List - rows are (text, deck dict); the search matches titles only
+        self.deck_model = TextListModel(parent=self, search_data=False)
+        self.deck_proxy = SubstringFilterProxy(self)
+        self.deck_proxy.setSourceModel(self.deck_model)
+        self.deck_list = QListView()
+        self.deck_list.setUniformItemSizes(True)
+        self.deck_list.setModel(self.deck_proxy)
+        self.deck_list.doubleClicked.connect(self.subscribe_selected)
         layout.addWidget(self.deck_list)
         
         # Status
@@ -1044,10 +1147,10 @@ class DeckBrowserDialog(QDialog):
         
         btn_row.addStretch()
         
-        sub_btn = QPushButton("Subscribe")
-        sub_btn.setStyleSheet(f"background-color: {COLORS['btn_primary']}; color: white; padding: 10px 20px; border: none; border-radius: 6px; font-weight: bold;")
-        btn_row.addWidget(sub_btn)
-        sub_btn.clicked.connect(self.subscribe_selected)
+        self.sub_btn = QPushButton("Subscribe")
+        self.sub_btn.setStyleSheet(_SUBSCRIBE_BTN_QSS)
+        btn_row.addWidget(self.sub_btn)
+        self.sub_btn.clicked.connect(self.subscribe_selected)
         
         
         close_btn = QPushButton("Close")
@@ -1060,32 +1163,44 @@ class DeckBrowserDialog(QDialog):
         self.load_decks()
     
     def load_decks(self):
-        """Load available decks from server"""
-        self.deck_list.clear()
+        """Load available decks from server (the request runs in the background)"""
+        if self._fetch_pending:
+            return
+        self._fetch_pending = True
+        self.deck_model.clear()
         self.status.setText("Loading...")
         
+        token = config.get_access_token_cached()
+        if token:
+            set_access_token(token)
+        
+        mw.taskman.run_in_background(api.browse_decks, self._on_decks_received)
+    
+    def _on_decks_received(self, future):
+        """Fill the deck list from the browse_decks result (runs on the main thread)"""
+        self._fetch_pending = False
+        if self._closed:
+            return
+        
         try:
-            token = config.get_access_token()
-            if token:
-                set_access_token(token)
-            
-            result = api.browse_decks()
+            result = future.result()
             
             if result.get('success') or 'decks' in result:
                 decks = result.get('decks', [])
-                downloaded = config.get_downloaded_decks()
+                downloaded = config.get_downloaded_decks_cached()
+                gid = _deck_id
+                rows = []
                 
                 for deck in decks:
-                    deck_id = deck.get('id')
+                    deck_id = gid(deck)
                     name = deck.get('title') or deck.get('name', 'Unknown')
                     
                     is_subscribed = deck_id in downloaded
                     prefix = "âœ“ " if is_subscribed else ""
                     
-                    item = QListWidgetItem(f"{prefix}{name}")
-                    item.setData(Qt.ItemDataRole.UserRole, deck)
-                    self.deck_list.addItem(item)
+                    rows.append((f"{prefix}{name}", deck))
                 
+                self.deck_model.set_rows(rows)
                 self.status.setText(f"{len(decks)} deck(s) available")
             else:
                 self.status.setText("Failed to load")
@@ -1095,20 +1210,17 @@ class DeckBrowserDialog(QDialog):
     
     def filter_decks(self):
         """Filter deck list"""
-        query = self.search.text().lower()
-        for i in range(self.deck_list.count()):
-            item = self.deck_list.item(i)
-            item.setHidden(query not in item.text().lower())
+        self.deck_proxy.set_query(self.search.text())
     
     def subscribe_selected(self):
         """Subscribe to selected deck"""
-        current = self.deck_list.currentItem()
-        if not current:
+        current = self.deck_list.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, "No Selection", "Select a deck first.")
             return
         
         deck = current.data(Qt.ItemDataRole.UserRole)
-        deck_id = deck.get('id')
+        deck_id = _deck_id(deck)
         deck_name = deck.get('title') or deck.get('name')
         
         # Check if already subscribed
@@ -1123,25 +1235,36 @@ class DeckBrowserDialog(QDialog):
     
     def _subscribe_and_install(self, deck, use_recommended):
         """Subscribe and install deck"""
-        deck_id = deck.get('id')
+        deck_id = _deck_id(deck)
         deck_name = deck.get('title') or deck.get('name')
         
         self.status.setText("Installing...")
-        QApplication.processEvents()
+        self.sub_btn.setEnabled(False)
         
+        token = config.get_access_token_cached()
+        if token:
+            set_access_token(token)
+        
+        # Get deck data (JSON) off the GUI thread; import happens back on main
+        mw.taskman.run_in_background(
+            lambda: api.download_deck(deck_id),
+            lambda future: self._on_subscribe_downloaded(future, deck_id, deck_name)
+        )
+    
+    def _on_subscribe_downloaded(self, future, deck_id, deck_name):
+        """
+        Import a downloaded deck and finish subscribing (runs on the main thread).
+        The import always runs; widget updates are skipped once the dialog is closed.
+        """
         try:
-            token = config.get_access_token()
-            if token:
-                set_access_token(token)
-            
-            # Get deck data (JSON) directly
-            result = api.download_deck(deck_id)
+            result = future.result()
             print(f"âœ“ download_deck response: success={result.get('success')}")
             
             if result.get('success'):
                 # Use unified JSON import
-                self.status.setText("Importing data...")
-                QApplication.processEvents()
+                if not self._closed:
+                    self.status.setText("Importing data...")
+                    QApplication.processEvents()
                 
                 # Import the deck
                 anki_deck_id = import_deck_from_json(result, deck_name)
@@ -1154,8 +1277,11 @@ class DeckBrowserDialog(QDialog):
                         title=result.get('title', deck_name),
                         card_count=len(result.get('cards', []))
                     )
-                    QMessageBox.information(self, "Success", f"Subscribed to {deck_name}!")
-                    self.accept()
+                    if self._closed:
+                        tooltip(f"Subscribed to {deck_name}!", parent=mw)
+                    else:
+                        QMessageBox.information(self, "Success", f"Subscribed to {deck_name}!")
+                        self.accept()
                 else:
                     raise Exception("Import returned invalid deck ID")
             else:
@@ -1163,8 +1289,14 @@ class DeckBrowserDialog(QDialog):
         
         except Exception as e:
             logger.error(f"Subscribe error: {e}")
-            self.status.setText("Failed")
-            QMessageBox.critical(self, "Error", f"Subscribe failed: {e}")
+            if self._closed:
+                showInfo(f"Subscribe to {deck_name} failed: {e}", parent=mw)
+            else:
+                self.status.setText("Failed")
+                QMessageBox.critical(self, "Error", f"Subscribe failed: {e}")
+        finally:
+            if not self._closed:
+                self.sub_btn.setEnabled(True)
 
 
 class SyncInstallDialog(QDialog):
@@ -8,15 +8,18 @@ from aqt.qt import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QListWidget, QListWidgetItem, QMessageBox, Qt,
     QTabWidget, QWidget, QCheckBox, QSpinBox, QGroupBox,
-    QFormLayout, QComboBox, QTextEdit, QProgressBar
+    QFormLayout, QComboBox, QTextEdit, QProgressBar, QTimer, QApplication
 )
 from aqt import mw
+import time
 import webbrowser
+from functools import partial
 
 from ..api_client import api, set_access_token, AnkiPHAPIError, ensure_valid_token
 from ..config import config
 from ..utils import escape_anki_search
 from .styles import COLORS, apply_dark_theme
+from .components import batched_updates, LazyTabsMixin, CloseAwareMixin
 from ..logger import logger
 from ..constants import (
     ADDON_VERSION, DOCS_URL, HELP_URL, CHANGELOG_URL,
@@ -24,7 +27,8 @@ from ..constants import (
 )
 
 
-
+# Server-deleted deck cleanup runs at most once per interval per dialog
+_BACKEND_CLEAN_INTERVAL = 60  # seconds
 
 
 def is_auth_error(error):
@@ -33,13 +37,15 @@ def is_auth_error(error):
     return any(x in error_str for x in ['expired', 'invalid', 'token', 'unauthorized', '401', 'auth'])
 
 
-class SettingsDialog(QDialog):
+class SettingsDialog(LazyTabsMixin, CloseAwareMixin, QDialog):
     """Settings dialog with multiple configuration tabs"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("AnkiPH Settings")
         self.setMinimumSize(600, 500)
+        self._deck_choices = None  # Selector rows shared by the deck selectors
+        self._last_backend_clean = float('-inf')  # time.monotonic() of the last cleanup check
         self.setup_ui()
         apply_dark_theme(self)
         self.load_settings()
@@ -57,26 +63,32 @@ class SettingsDialog(QDialog):
         
         # Tab widget
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("QTabBar::tab { padding: 8px 20px; }")
+        self.tabs.setProperty("class", "compact")
         
-        # Create tabs
+        # Create tabs - only General is built up front; the others are
+        # built the first time they are shown (see _ensure_tab_built)
         self.general_tab = self.create_general_tab()
-        self.protected_fields_tab = self.create_protected_fields_tab()
-        self.advanced_tab = self.create_advanced_tab()
+        self.protected_fields_tab = self._create_tab_container()
+        self.advanced_tab = self._create_tab_container()
+        self.about_tab = self._create_tab_container()
         
         self.tabs.addTab(self.general_tab, "🔧 General")
         self.tabs.addTab(self.protected_fields_tab, "🛡️ Protected Fields")
         self.tabs.addTab(self.advanced_tab, "⚡ Advanced")
-        
-        # Add About tab
-        self.about_tab = self.create_about_tab()
         self.tabs.addTab(self.about_tab, "ℹ️ About")
+        self._tab_builders = {
+            self.tabs.indexOf(self.protected_fields_tab): self._build_protected_fields_tab,
+            self.tabs.indexOf(self.advanced_tab): self.create_advanced_tab,
+            self.tabs.indexOf(self.about_tab): self.create_about_tab,
+        }
         
         # Add Admin tab only if user is admin
         if config.is_admin():
-            self.admin_tab = self.create_admin_tab()
-            self.tabs.addTab(self.admin_tab, "👑 Admin")
+            self.admin_tab = self._create_tab_container()
+            index = self.tabs.addTab(self.admin_tab, "👑 Admin")
+            self._tab_builders[index] = self.create_admin_tab
         
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         layout.addWidget(self.tabs)
         
         # Bottom buttons
@@ -97,6 +109,12 @@ class SettingsDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
+    def _build_protected_fields_tab(self):
+        """Create the Protected Fields tab and fill its deck selector"""
+        tab = self.create_protected_fields_tab()
+        self.load_deck_list()
+        return tab
+    
     def create_general_tab(self):
         """Create General settings tab"""
         tab = QWidget()
@@ -165,7 +183,6 @@ class SettingsDialog(QDialog):
         fields_layout = QVBoxLayout()
         
         self.protected_fields_list = QListWidget()
-        self.protected_fields_list.setStyleSheet("QListWidget::item { padding: 8px; }")
         fields_layout.addWidget(self.protected_fields_list)
         
         # Add/Remove buttons
@@ -188,9 +205,9 @@ class SettingsDialog(QDialog):
         layout.addWidget(fields_group)
         
         # Fetch from server button
-        fetch_btn = QPushButton("🔄 Fetch Protected Fields from Server")
-        fetch_btn.clicked.connect(self.fetch_protected_fields)
-        layout.addWidget(fetch_btn)
+        self.fetch_fields_btn = QPushButton("🔄 Fetch Protected Fields from Server")
+        self.fetch_fields_btn.clicked.connect(self.fetch_protected_fields)
+        layout.addWidget(self.fetch_fields_btn)
         
         layout.addStretch()
         tab.setLayout(layout)
@@ -296,17 +313,17 @@ class SettingsDialog(QDialog):
         
         docs_btn = QPushButton("📖 Documentation")
         docs_btn.setStyleSheet("text-align: left; padding: 10px;")
-        docs_btn.clicked.connect(lambda: webbrowser.open(DOCS_URL))
+        docs_btn.clicked.connect(partial(webbrowser.open, DOCS_URL))
         help_layout.addWidget(docs_btn)
         
         help_btn = QPushButton("🆘 Get Help")
         help_btn.setStyleSheet("text-align: left; padding: 10px;")
-        help_btn.clicked.connect(lambda: webbrowser.open(HELP_URL))
+        help_btn.clicked.connect(partial(webbrowser.open, HELP_URL))
         help_layout.addWidget(help_btn)
         
         changelog_btn = QPushButton("📝 Changelog")
         changelog_btn.setStyleSheet("text-align: left; padding: 10px;")
-        changelog_btn.clicked.connect(lambda: webbrowser.open(CHANGELOG_URL))
+        changelog_btn.clicked.connect(partial(webbrowser.open, CHANGELOG_URL))
         help_layout.addWidget(changelog_btn)
         
         help_group.setLayout(help_layout)
@@ -319,12 +336,12 @@ class SettingsDialog(QDialog):
         
         terms_btn = QPushButton("📜 Terms & Conditions")
         terms_btn.setStyleSheet("text-align: left; padding: 10px;")
-        terms_btn.clicked.connect(lambda: webbrowser.open(TERMS_URL))
+        terms_btn.clicked.connect(partial(webbrowser.open, TERMS_URL))
         legal_layout.addWidget(terms_btn)
         
         privacy_btn = QPushButton("🔒 Privacy Policy")
         privacy_btn.setStyleSheet("text-align: left; padding: 10px;")
-        privacy_btn.clicked.connect(lambda: webbrowser.open(PRIVACY_URL))
+        privacy_btn.clicked.connect(partial(webbrowser.open, PRIVACY_URL))
         legal_layout.addWidget(privacy_btn)
         
         legal_group.setLayout(legal_layout)
@@ -336,7 +353,7 @@ class SettingsDialog(QDialog):
             "padding: 12px; font-weight: bold; "
             "background-color: #3b82f6; color: white; border-radius: 5px;"
         )
-        homepage_btn.clicked.connect(lambda: webbrowser.open(HOMEPAGE_URL))
+        homepage_btn.clicked.connect(partial(webbrowser.open, HOMEPAGE_URL))
         layout.addWidget(homepage_btn)
         
         layout.addStretch()
@@ -348,9 +365,21 @@ class SettingsDialog(QDialog):
         self.advanced_deck_selector.clear()
         self.advanced_deck_selector.addItem("-- Select a deck --", None)
         
-        downloaded_decks = config.get_downloaded_decks()
+        # Names resolved here are reused by every advanced action
+        self._advanced_deck_names = names = {}
+        
+        for display_text, deck_id, deck_name in self._get_deck_choices():
+            names[deck_id] = deck_name
+            self.advanced_deck_selector.addItem(display_text, deck_id)
+    
+    def _get_deck_choices(self):
+        """(display text, deck id, deck name) per downloaded deck, resolved once per dialog"""
+        if self._deck_choices is not None:
+            return self._deck_choices
         
-        for deck_id, deck_info in downloaded_decks.items():
+        choices = []
+        for deck_id, deck_info in config.get_downloaded_decks().items():
+            # Get deck name from Anki if possible
             anki_deck_id = deck_info.get('anki_deck_id')
             deck_name = f"Deck {deck_id[:8]}"
             
@@ -362,8 +391,18 @@ class SettingsDialog(QDialog):
                 except:
                     pass
             
-            version = deck_info.get('version', '?')
-            self.advanced_deck_selector.addItem(f"{deck_name} (v{version})", deck_id)
+            choices.append((f"{deck_name} (v{deck_info.get('version', '?')})", deck_id, deck_name))
+        
+        self._deck_choices = choices
+        return choices
+    
+    def _tracked_decks_changed(self):
+        """Drop the cached deck choices and refill any deck selector already built"""
+        self._deck_choices = None
+        if hasattr(self, 'deck_selector'):
+            self.load_deck_list()
+        if hasattr(self, 'advanced_deck_selector'):
+            self._load_advanced_decks()
     
     def _get_selected_deck(self):
         """Get selected deck ID and name for advanced operations"""
@@ -372,19 +411,7 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "No Deck", "Please select a deck first.")
             return None, None
         
-        deck_info = config.get_downloaded_decks().get(deck_id, {})
-        anki_deck_id = deck_info.get('anki_deck_id')
-        deck_name = f"Deck {deck_id[:8]}"
-        
-        if anki_deck_id and mw.col:
-            try:
-                deck = mw.col.decks.get(int(anki_deck_id))
-                if deck:
-                    deck_name = deck['name']
-            except:
-                pass
-        
-        return deck_id, deck_name
+        return deck_id, self._advanced_deck_names.get(deck_id, f"Deck {deck_id[:8]}")
     
     def _open_card_history(self):
         """Open card history dialog"""
@@ -427,79 +454,75 @@ class SettingsDialog(QDialog):
     
     def _sync_tags(self):
         """Sync tags with server"""
-        deck_id, deck_name = self._get_selected_deck()
-        if not deck_id:
-            return
-        
-        self.advanced_status.setText("⏳ Syncing tags...")
-        try:
-            if ensure_valid_token():
-                result = api.sync_tags(deck_id, action="pull")
-                if result.get('success'):
-                    self.advanced_status.setText(f"✓ Tags synced: +{result.get('tags_added', 0)} -{result.get('tags_removed', 0)}")
-                else:
-                    self.advanced_status.setText("❌ Tag sync failed")
-            else:
-                self.advanced_status.setText("❌ Not logged in")
-        except Exception as e:
-            self.advanced_status.setText(f"❌ Error: {e}")
+        self._run_advanced_sync(
+            "⏳ Syncing tags...",
+            lambda deck_id: api.sync_tags(deck_id, action="pull"),
+            lambda r: f"✓ Tags synced: +{r.get('tags_added', 0)} -{r.get('tags_removed', 0)}",
+            "❌ Tag sync failed"
+        )
     
     def _sync_suspend(self):
         """Sync suspend state with server"""
-        deck_id, deck_name = self._get_selected_deck()
-        if not deck_id:
-            return
-        
-        self.advanced_status.setText("⏳ Syncing suspend state...")
-        try:
-            if ensure_valid_token():
-                result = api.sync_suspend_state(deck_id, action="pull")
-                if result.get('success'):
-                    self.advanced_status.setText(f"✓ Suspend state synced: {result.get('cards_updated', 0)} cards")
-                else:
-                    self.advanced_status.setText("❌ Suspend sync failed")
-            else:
-                self.advanced_status.setText("❌ Not logged in")
-        except Exception as e:
-            self.advanced_status.setText(f"❌ Error: {e}")
+        self._run_advanced_sync(
+            "⏳ Syncing suspend state...",
+            lambda deck_id: api.sync_suspend_state(deck_id, action="pull"),
+            lambda r: f"✓ Suspend state synced: {r.get('cards_updated', 0)} cards",
+            "❌ Suspend sync failed"
+        )
     
     def _sync_media(self):
         """Sync media with server"""
-        deck_id, deck_name = self._get_selected_deck()
-        if not deck_id:
-            return
-        
-        self.advanced_status.setText("⏳ Syncing media...")
-        try:
-            if ensure_valid_token():
-                result = api.sync_media(deck_id, action="download")
-                if result.get('success'):
-                    self.advanced_status.setText(f"✓ Media synced: {result.get('files_downloaded', 0)} files")
-                else:
-                    self.advanced_status.setText("❌ Media sync failed")
-            else:
-                self.advanced_status.setText("❌ Not logged in")
-        except Exception as e:
-            self.advanced_status.setText(f"❌ Error: {e}")
+        self._run_advanced_sync(
+            "⏳ Syncing media...",
+            lambda deck_id: api.sync_media(deck_id, action="download"),
+            lambda r: f"✓ Media synced: {r.get('files_downloaded', 0)} files",
+            "❌ Media sync failed"
+        )
     
     def _sync_note_types(self):
         """Sync note types with server"""
+        self._run_advanced_sync(
+            "⏳ Syncing note types...",
+            lambda deck_id: api.sync_note_types(deck_id, action="get"),
+            lambda r: f"✓ Note types synced: {r.get('types_updated', 0)} types",
+            "❌ Note type sync failed"
+        )
+    
+    def _run_advanced_sync(self, busy_text, request, success_text, failure_text):
+        """Run an advanced sync request for the selected deck off the GUI thread"""
         deck_id, deck_name = self._get_selected_deck()
         if not deck_id:
             return
         
-        self.advanced_status.setText("⏳ Syncing note types...")
+        self.advanced_status.setText(busy_text)
+        
+        def _request():
+            # Token refresh is a network call too, so it stays in the background
+            if not ensure_valid_token():
+                return None
+            return request(deck_id)
+        
+        mw.taskman.run_in_background(
+            _request,
+            lambda future: self._on_advanced_sync_done(future, success_text, failure_text)
+        )
+    
+    def _on_advanced_sync_done(self, future, success_text, failure_text):
+        """Report an advanced sync result (runs on the main thread)"""
+        if self._closed:
+            return
         try:
-            if ensure_valid_token():
-                result = api.sync_note_types(deck_id, action="get")
-                if result.get('success'):
-                    self.advanced_status.setText(f"✓ Note types synced: {result.get('types_updated', 0)} types")
-                else:
-                    self.advanced_status.setText("❌ Note type sync failed")
-            else:
-                self.advanced_status.setText("❌ Not logged in")
+            result = future.result()
         except Exception as e:
             self.advanced_status.setText(f"❌ Error: {e}")
+            return
+        
+        if result is None:
+            self.advanced_status.setText("❌ Not logged in")
+        elif result.get('success'):
+            self.advanced_status.setText(success_text(result))
+        else:
+            self.advanced_status.setText(failure_text)
     
     def load_settings(self):
         """Load current settings into UI"""
@@ -508,31 +531,14 @@ class SettingsDialog(QDialog):
         self.update_interval.setValue(config.get_update_check_interval_hours())
         self.auto_sync_enabled.setChecked(config.get_auto_sync_enabled())
         
-        # Protected fields tab - load decks
-        self.load_deck_list()
+        # Protected fields tab loads its decks when first shown
     
     def load_deck_list(self):
         """Load downloaded decks into deck selector"""
         self.deck_selector.clear()
         self.deck_selector.addItem("-- Select a deck --", None)
         
-        downloaded_decks = config.get_downloaded_decks()
-        
-        for deck_id, deck_info in downloaded_decks.items():
-            # Get deck name from Anki if possible
-            anki_deck_id = deck_info.get('anki_deck_id')
-            deck_name = f"Deck {deck_id[:8]}"
-            
-            if anki_deck_id and mw.col:
-                try:
-                    deck = mw.col.decks.get(int(anki_deck_id))
-                    if deck:
-                        deck_name = deck['name']
-                except:
-                    pass
-            
-            version = deck_info.get('version', '?')
-            display_text = f"{deck_name} (v{version})"
+        for display_text, deck_id, _name in self._get_deck_choices():
             self.deck_selector.addItem(display_text, deck_id)
     
     def on_deck_selected(self, index):
@@ -546,10 +552,11 @@ class SettingsDialog(QDialog):
         # Load protected fields for this deck
         protected = config.get_protected_fields(deck_id)
         
-        for field_name in protected:
-            item = QListWidgetItem(f"🛡️ {field_name}")
-            item.setData(Qt.ItemDataRole.UserRole, field_name)
-            self.protected_fields_list.addItem(item)
+        with batched_updates(self.protected_fields_list):
+            for field_name in protected:
+                item = QListWidgetItem(f"🛡️ {field_name}")
+                item.setData(Qt.ItemDataRole.UserRole, field_name)
+                self.protected_fields_list.addItem(item)
     
     def add_protected_field(self):
         """Add a new protected field"""
@@ -614,15 +621,27 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "No Deck Selected", "Please select a deck first.")
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
         
         set_access_token(token)
         
+        self.fetch_fields_btn.setEnabled(False)
+        mw.taskman.run_in_background(
+            lambda: api.get_protected_fields(deck_id),
+            lambda future: self._on_protected_fields_fetched(future, deck_id)
+        )
+    
+    def _on_protected_fields_fetched(self, future, deck_id):
+        """Apply server protected fields (runs on the main thread)"""
+        if self._closed:
+            return
+        self.fetch_fields_btn.setEnabled(True)
+        
         try:
-            result = api.get_protected_fields(deck_id)
+            result = future.result()
             
             if result.get('success'):
                 server_fields = result.get('protected_fields', [])
@@ -797,14 +816,17 @@ class SettingsDialog(QDialog):
         self.admin_progress.setMinimumHeight(20)
         self.admin_progress.setTextVisible(True)
         self.admin_progress.setValue(0)
+        self.admin_progress.setVisible(False)  # Shown when an operation starts
         status_layout.addWidget(self.admin_progress)
         
-        # Status log
-        self.admin_status = QTextEdit()
-        self.admin_status.setReadOnly(True)
-        self.admin_status.setMaximumHeight(80)
-        self.admin_status.setPlaceholderText("Operation status will appear here...")
-        status_layout.addWidget(self.admin_status)
+        # Status log - the QTextEdit is only built once something is logged,
+        # most visits to this tab never run an operation
+        self.admin_status = None
+        self.admin_status_placeholder = QLabel("Operation status will appear here...")
+        self.admin_status_placeholder.setProperty("class", "muted")
+        status_layout.addWidget(self.admin_status_placeholder)
+        self._admin_status_layout = status_layout
+        self._admin_log_buffer = []  # Pending lines, flushed once per event-loop pass
         
         status_group.setLayout(status_layout)
         layout.addWidget(status_group)
@@ -821,18 +843,20 @@ class SettingsDialog(QDialog):
         if not mw.col:
             return
         
-        # Clean up stale backend entries first
-        try:
-            from ..sync import clean_deleted_backend_decks
-            cleaned = clean_deleted_backend_decks()
-            if cleaned > 0:
-                logger.info(f"Cleaned {cleaned} server-deleted deck(s) from config")
-        except Exception as e:
-            logger.error(f"Cleanup check failed: {e}")
+        # Stale backend entries are checked in the background after the list is shown
+        if time.monotonic() - self._last_backend_clean > _BACKEND_CLEAN_INTERVAL:
+            self._last_backend_clean = time.monotonic()
+            self._clean_backend_decks()
         
         # Get all Anki decks
         all_decks = mw.col.decks.all_names_and_ids()
         
+        # Anki deck id -> AnkiPH deck id, built once instead of scanned per deck
+        # (first match wins, as with the previous per-deck scan)
+        ankiph_ids = {}
+        for nid, info in config.get_downloaded_decks_cached().items():
+            ankiph_ids.setdefault(info.get('anki_deck_id'), nid)
+        
         for deck in all_decks:
             deck_name = deck.name
             anki_id = deck.id
@@ -842,34 +866,90 @@ class SettingsDialog(QDialog):
                 continue
             
             # Check if this deck is already tracked (has a AnkiPH deck_id)
-            downloaded = config.get_downloaded_decks()
-            ankiph_id = None
-            for nid, info in downloaded.items():
-                if info.get('anki_deck_id') == anki_id:
-                    ankiph_id = nid
-                    break
+            ankiph_id = ankiph_ids.get(anki_id)
             
             # Store anki_id as data since we need to look up cards by it
-            display_text = f"{deck_name}"
-            if ankiph_id:
-                display_text += f" (ID: {ankiph_id[:8]}...)"
+            display_text = f"{deck_name} (ID: {ankiph_id[:8]}...)" if ankiph_id else deck_name
             
             # Store tuple of (anki_id, ankiph_id)
             self.admin_deck_selector.addItem(display_text, (anki_id, ankiph_id))
     
+    def _clean_backend_decks(self):
+        """Check for server-deleted decks off the GUI thread"""
+        from ..sync import find_deleted_backend_decks
+        
+        if not config.is_logged_in():
+            return
+        tracked = list(config.get_downloaded_decks_cached())
+        if not tracked:
+            return
+        
+        mw.taskman.run_in_background(
+            lambda: find_deleted_backend_decks(tracked),
+            self._on_backend_decks_checked
+        )
+    
+    def _on_backend_decks_checked(self, future):
+        """Drop server-deleted decks from config; reload the lists if any were removed"""
+        from ..sync import remove_deleted_backend_decks
+        
+        try:
+            cleaned = remove_deleted_backend_decks(future.result())
+        except Exception as e:
+            logger.error(f"Cleanup check failed: {e}")
+            return
+        if cleaned > 0 and not self._closed:
+            logger.info(f"Cleaned {cleaned} server-deleted deck(s) from config")
+            self._tracked_decks_changed()
+            self.load_admin_decks()
+    
     def admin_log(self, message):
-        """Add message to admin status log"""
-        self.admin_status.append(message)
+        """Add message to admin status log (batched until the event loop runs)"""
+        self.admin_log_many((message,))
+    
+    def admin_log_many(self, messages):
+        """Add several messages to admin status log as a single update"""
+        buffer = self._admin_log_buffer
+        was_empty = not buffer
+        buffer.extend(messages)
+        if was_empty and buffer:
+            QTimer.singleShot(0, self._flush_admin_log)
+    
+    def _flush_admin_log(self):
+        """Append all pending log lines in one QTextEdit update"""
+        lines = self._admin_log_buffer
+        if not lines:
+            return
+        self._admin_log_buffer = []
+        status = self._ensure_admin_status()
+        status.append("\n".join(lines))
         # Scroll to bottom
-        scrollbar = self.admin_status.verticalScrollBar()
+        scrollbar = status.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
-    def admin_set_progress(self, value, maximum=100):
+    def _ensure_admin_status(self):
+        """Create the admin status log on first use, replacing the placeholder"""
+        if self.admin_status is None:
+            self.admin_status = QTextEdit()
+            self.admin_status.setReadOnly(True)
+            self.admin_status.setMaximumHeight(80)
+            self.admin_status_placeholder.setVisible(False)
+            self._admin_status_layout.addWidget(self.admin_status)
+        return self.admin_status
+    
+    def admin_start_progress(self, total, unit="batches"):
+        """Set the progress range and label once for an operation"""
+        self.admin_progress.setRange(0, total)
+        self.admin_progress.setFormat(f"%v / %m {unit}")
+        self.admin_progress.setValue(0)
+        self.admin_progress.setVisible(True)
+    
+    def admin_set_progress(self, value):
         """Update progress bar"""
-        self.admin_progress.setMaximum(maximum)
-        self.admin_progress.setValue(value)
+        # Skip no-op updates - each change repaints the bar
+        if self.admin_progress.value() != value:
+            self.admin_progress.setValue(value)
         # Process events to update UI
-        from aqt.qt import QApplication
         QApplication.processEvents()
     
     def on_admin_deck_selected(self, index):
@@ -955,7 +1035,8 @@ class SettingsDialog(QDialog):
                 f"Successfully unlinked '{deck_name}' from server.\n\n"
                 "You can now link it to a different server deck or create a new one."
             )
-            # Reload the deck list to reflect the change
+            # Reload the deck lists to reflect the change
+            self._tracked_decks_changed()
             self.load_admin_decks()
         else:
             self.admin_log(f"✗ Failed to unlink deck")
@@ -1086,14 +1167,14 @@ class SettingsDialog(QDialog):
             total_batches = (total_cards + CHUNK_SIZE - 1) // CHUNK_SIZE
             
             self.admin_log(f"🚀 Pushing in {total_batches} batches of {CHUNK_SIZE}...")
-            self.admin_set_progress(0, total_batches)
+            self.admin_start_progress(total_batches)
             
             for i in range(0, total_cards, CHUNK_SIZE):
                 chunk = changes[i:i + CHUNK_SIZE]
                 batch_num = (i // CHUNK_SIZE) + 1
                 
                 self.admin_log(f"📤 Pushing batch {batch_num}/{total_batches} ({len(chunk)} cards)...")
-                self.admin_set_progress(batch_num - 1, total_batches)
+                self.admin_set_progress(batch_num - 1)
                 
                 # Only first batch gets version_notes
                 notes = version_notes if i == 0 else None
@@ -1109,15 +1190,18 @@ class SettingsDialog(QDialog):
                 else:
                     self.admin_log(f"⚠ Batch {batch_num} error: {result.get('error', 'Unknown')}")
                 
-                self.admin_set_progress(batch_num, total_batches)
+                self.admin_set_progress(batch_num)
             
             # Final success
-            self.admin_log(f"✅ Push complete! {total_pushed} cards pushed")
-            self.admin_log(f"📌 Added: {total_added}, Modified: {total_modified}")
-            self.admin_log(f"📌 New version: {version}")
+            self.admin_log_many((
+                f"✅ Push complete! {total_pushed} cards pushed",
+                f"📌 Added: {total_added}, Modified: {total_modified}",
+                f"📌 New version: {version}",
+            ))
             
             # Update local version
             config.update_deck_version(deck_id, version)
+            self._tracked_decks_changed()
             
             QMessageBox.information(
                 self, "Push Successful",
@@ -1273,7 +1357,7 @@ class SettingsDialog(QDialog):
             total_batches = (total_cards + CHUNK_SIZE - 1) // CHUNK_SIZE
             
             self.admin_log(f"📥 Uploading in {total_batches} batches of {CHUNK_SIZE}...")
-            self.admin_set_progress(0, total_batches)
+            self.admin_start_progress(total_batches)
             
             failed_batch = None
             retry_count = 0
@@ -1284,7 +1368,7 @@ class SettingsDialog(QDialog):
                 batch_num = (i // CHUNK_SIZE) + 1
                 
                 self.admin_log(f"📤 Uploading batch {batch_num}/{total_batches} ({len(chunk)} cards)...")
-                self.admin_set_progress(batch_num - 1, total_batches)
+                self.admin_set_progress(batch_num - 1)
                 
                 # Retry logic for each batch
                 batch_success = False
@@ -1319,6 +1403,7 @@ class SettingsDialog(QDialog):
                                     self.admin_log(f"🆕 Created deck: {created_deck_id}")
                                     # Save tracking immediately after deck creation
                                     config.save_downloaded_deck(created_deck_id, version, anki_deck_id)
+                                    self._tracked_decks_changed()
                                 batch_success = True
                             else:
                                 raise Exception(f"First batch failed: {result.get('error')}")
@@ -1343,16 +1428,16 @@ class SettingsDialog(QDialog):
                     except Exception as batch_error:
                         # Check if this is an auth error - don't retry auth errors
                         if is_auth_error(batch_error):
-                            self.admin_log(f"❌ Authentication error: {batch_error}")
-                            self.admin_log(f"🔑 Please re-login and try again")
+                            self.admin_log_many((
+                                f"❌ Authentication error: {batch_error}",
+                                "🔑 Please re-login and try again",
+                            ))
                             raise batch_error
                         
                         retry_count = attempt + 1
                         if retry_count < max_retries:
                             self.admin_log(f"⚠ Batch {batch_num} failed (attempt {retry_count}/{max_retries}), retrying...")
                             # Short delay before retry
-                            from aqt.qt import QApplication
-                            import time
                             QApplication.processEvents()
                             time.sleep(2)
                         else:
@@ -1366,15 +1451,18 @@ class SettingsDialog(QDialog):
                     total_imported += batch_imported
                     self.admin_log(f"✓ Batch {batch_num} done ({total_imported}/{total_cards})")
                 
-                self.admin_set_progress(batch_num, total_batches)
+                self.admin_set_progress(batch_num)
             
             # Final success
-            self.admin_log(f"✅ Import complete! {total_imported} cards imported")
-            self.admin_log(f"📌 Version: {version}")
+            self.admin_log_many((
+                f"✅ Import complete! {total_imported} cards imported",
+                f"📌 Version: {version}",
+            ))
             
             # Update deck tracking with final version
             if created_deck_id:
                 config.save_downloaded_deck(created_deck_id, version, anki_deck_id)
+                self._tracked_decks_changed()
             
             QMessageBox.information(
                 self, "Import Successful",
@@ -1388,8 +1476,11 @@ class SettingsDialog(QDialog):
             # Save partial progress
             if created_deck_id and total_imported > 0:
                 config.save_downloaded_deck(created_deck_id, version, anki_deck_id)
-                self.admin_log(f"💾 Saved partial progress: {total_imported} cards")
-                self.admin_log(f"📋 Deck ID: {created_deck_id}")
+                self._tracked_decks_changed()
+                self.admin_log_many((
+                    f"💾 Saved partial progress: {total_imported} cards",
+                    f"📋 Deck ID: {created_deck_id}",
+                ))
                 
                 reply = QMessageBox.warning(
                     self, "Partial Import",
@@ -1403,7 +1494,6 @@ class SettingsDialog(QDialog):
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                 )
                 if reply == QMessageBox.StandardButton.Yes:
-                    from aqt.qt import QApplication
                     QApplication.clipboard().setText(created_deck_id)
                     self.admin_log("📋 Deck ID copied to clipboard")
             else:
@@ -1414,8 +1504,11 @@ class SettingsDialog(QDialog):
             # Save partial progress
             if created_deck_id and total_imported > 0:
                 config.save_downloaded_deck(created_deck_id, version, anki_deck_id)
-                self.admin_log(f"💾 Saved partial progress: {total_imported} cards")
-                self.admin_log(f"📋 Deck ID: {created_deck_id}")
+                self._tracked_decks_changed()
+                self.admin_log_many((
+                    f"💾 Saved partial progress: {total_imported} cards",
+                    f"📋 Deck ID: {created_deck_id}",
+                ))
                 
                 QMessageBox.warning(
                     self, "Partial Import",
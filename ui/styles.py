@@ -4,6 +4,8 @@ Centralized dark theme and color constants
 Version: 4.0.0
 """
 
+import sys
+
 # Color palette
 COLORS = {
     # Backgrounds
@@ -36,239 +38,238 @@ COLORS = {
     "btn_secondary_hover": "#666666",
 }
 
-# Base dark theme stylesheet
-DARK_THEME = f"""
-    QDialog, QWidget {{
+# Base dark theme stylesheet, one rule per segment
+_THEME_PARTS = (
+    f"""QDialog, QWidget {{
         background-color: {COLORS["bg_secondary"]};
         color: {COLORS["text_primary"]};
-    }}
-    
-    QLabel {{
+    }}""",
+    f"""QLabel {{
         color: {COLORS["text_primary"]};
         font-size: 13px;
-    }}
-    
-    QLabel[class="title"] {{
+    }}""",
+    f"""QLabel[class="title"] {{
         font-size: 16px;
         font-weight: bold;
         padding: 10px;
-    }}
-    
-    QLabel[class="subtitle"] {{
+    }}""",
+    f"""QLabel[class="subtitle"] {{
         font-size: 14px;
         font-weight: bold;
-    }}
-    
-    QLabel[class="muted"] {{
+    }}""",
+    f"""QLabel[class="muted"] {{
         color: {COLORS["text_muted"]};
         font-size: 12px;
-    }}
-    
-    QLineEdit, QTextEdit {{
+    }}""",
+    f"""QLabel[class="status"] {{
+        color: {COLORS["text_muted"]};
+        font-size: 11px;
+        padding: 5px;
+    }}""",
+    f"""QLabel[class="details"] {{
+        background-color: {COLORS["bg_primary"]};
+        border: 1px solid {COLORS["border"]};
+        border-radius: 4px;
+        padding: 6px 8px;
+    }}""",
+    f"""QLineEdit, QTextEdit {{
         background-color: {COLORS["bg_primary"]};
         border: 1px solid {COLORS["border"]};
         border-radius: 4px;
         padding: 8px 12px;
         color: {COLORS["text_primary"]};
         font-size: 13px;
-    }}
-    
-    QLineEdit:focus, QTextEdit:focus {{
+    }}""",
+    f"""QLineEdit:focus, QTextEdit:focus {{
         border-color: {COLORS["border_focus"]};
-    }}
-    
-    QLineEdit::placeholder {{
+    }}""",
+    f"""QTextEdit[role="readonly"] {{
+        background-color: {COLORS["bg_tertiary"]};
+    }}""",
+    f"""QLineEdit::placeholder {{
         color: {COLORS["text_muted"]};
-    }}
-    
-    QPushButton {{
+    }}""",
+    f"""QPushButton {{
         background-color: {COLORS["btn_secondary"]};
         border: none;
         border-radius: 4px;
         padding: 8px 16px;
         color: {COLORS["text_primary"]};
         font-size: 13px;
-    }}
-    
-    QPushButton:hover {{
+    }}""",
+    f"""QPushButton:hover {{
         background-color: {COLORS["btn_secondary_hover"]};
-    }}
-    
-    QPushButton:pressed {{
+    }}""",
+    f"""QPushButton:pressed {{
         background-color: {COLORS["bg_tertiary"]};
-    }}
-    
-    QPushButton:disabled {{
+    }}""",
+    f"""QPushButton:disabled {{
         background-color: {COLORS["bg_tertiary"]};
         color: {COLORS["text_muted"]};
-    }}
-    
-    QPushButton[class="primary"] {{
+    }}""",
+    f"""QPushButton[class="primary"] {{
         background-color: {COLORS["btn_primary"]};
         font-weight: bold;
-    }}
-    
-    QPushButton[class="primary"]:hover {{
+    }}""",
+    f"""QPushButton[class="primary"]:hover {{
         background-color: {COLORS["btn_primary_hover"]};
-    }}
-    
-    QPushButton[class="success"] {{
+    }}""",
+    f"""QPushButton[class="success"] {{
         background-color: {COLORS["success"]};
         font-weight: bold;
-    }}
-    
-    QPushButton[class="warning"] {{
+    }}""",
+    f"""QPushButton[class="submit"] {{
+        background-color: {COLORS["success"]};
+        color: {COLORS["text_primary"]};
+        font-weight: bold;
+        padding: 10px;
+    }}""",
+    f"""QPushButton[class="warning"] {{
         background-color: {COLORS["warning"]};
         font-weight: bold;
-    }}
-    
-    QPushButton[class="danger"] {{
+    }}""",
+    f"""QPushButton[class="danger"] {{
         background-color: {COLORS["error"]};
         font-weight: bold;
-    }}
-    
-    QListWidget {{
+    }}""",
+    f"""QListView {{
         background-color: {COLORS["bg_primary"]};
         border: 1px solid {COLORS["border"]};
         border-radius: 4px;
         padding: 4px;
-    }}
-    
-    QListWidget::item {{
+    }}""",
+    f"""QListView::item {{
         padding: 8px;
         border-radius: 4px;
         margin: 2px;
-    }}
-    
-    QListWidget::item:hover {{
+    }}""",
+    f"""QListView[class="compact"]::item {{
+        padding: 5px;
+    }}""",
+    f"""QListView[class="roomy"]::item {{
+        padding: 10px;
+    }}""",
+    f"""QListView::item:hover {{
         background-color: {COLORS["bg_hover"]};
-    }}
-    
-    QListWidget::item:selected {{
+    }}""",
+    f"""QListView::item:selected {{
         background-color: {COLORS["bg_selected"]};
-    }}
-    
-    QTabWidget::pane {{
+    }}""",
+    f"""QTabWidget::pane {{
         border: 1px solid {COLORS["border"]};
         border-radius: 4px;
         background-color: {COLORS["bg_secondary"]};
-    }}
-    
-    QTabBar::tab {{
+    }}""",
+    f"""QTabBar::tab {{
         background-color: {COLORS["bg_tertiary"]};
         color: {COLORS["text_secondary"]};
         padding: 10px 20px;
         margin-right: 2px;
         border-top-left-radius: 4px;
         border-top-right-radius: 4px;
-    }}
-    
-    QTabBar::tab:selected {{
+    }}""",
+    f"""QTabWidget[class="compact"] QTabBar::tab {{
+        padding: 8px 20px;
+    }}""",
+    f"""QTabBar::tab:selected {{
         background-color: {COLORS["bg_selected"]};
         color: {COLORS["text_primary"]};
-    }}
-    
-    QTabBar::tab:hover:!selected {{
+    }}""",
+    f"""QTabBar::tab:hover:!selected {{
         background-color: {COLORS["bg_hover"]};
-    }}
-    
-    QGroupBox {{
+    }}""",
+    f"""QGroupBox {{
         border: 1px solid {COLORS["border"]};
         border-radius: 4px;
         margin-top: 12px;
         padding-top: 8px;
         font-weight: bold;
-    }}
-    
-    QGroupBox::title {{
+    }}""",
+    f"""QGroupBox::title {{
         subcontrol-origin: margin;
         left: 10px;
         padding: 0 5px;
-    }}
-    
-    QCheckBox {{
+    }}""",
+    f"""QCheckBox {{
         color: {COLORS["text_primary"]};
         spacing: 8px;
-    }}
-    
-    QCheckBox::indicator {{
+    }}""",
+    f"""QCheckBox::indicator {{
         width: 16px;
         height: 16px;
         border: 1px solid {COLORS["border"]};
         border-radius: 3px;
         background-color: {COLORS["bg_primary"]};
-    }}
-    
-    QCheckBox::indicator:checked {{
+    }}""",
+    f"""QCheckBox::indicator:checked {{
         background-color: {COLORS["btn_primary"]};
         border-color: {COLORS["btn_primary"]};
-    }}
-    
-    QProgressBar {{
+    }}""",
+    f"""QProgressBar {{
         border: 1px solid {COLORS["border"]};
         border-radius: 4px;
         text-align: center;
         background-color: {COLORS["bg_primary"]};
-    }}
-    
-    QProgressBar::chunk {{
+    }}""",
+    f"""QProgressBar::chunk {{
         background-color: {COLORS["btn_primary"]};
         border-radius: 3px;
-    }}
-    
-    QComboBox {{
+    }}""",
+    f"""QComboBox {{
         background-color: {COLORS["bg_primary"]};
         border: 1px solid {COLORS["border"]};
         border-radius: 4px;
         padding: 6px 12px;
         color: {COLORS["text_primary"]};
-    }}
-    
-    QComboBox:hover {{
+    }}""",
+    f"""QComboBox:hover {{
         border-color: {COLORS["border_focus"]};
-    }}
-    
-    QComboBox::drop-down {{
+    }}""",
+    f"""QComboBox::drop-down {{
         border: none;
         padding-right: 10px;
-    }}
-    
-    QScrollBar:vertical {{
+    }}""",
+    f"""QScrollBar:vertical {{
         background-color: {COLORS["bg_primary"]};
         width: 12px;
         border-radius: 6px;
-    }}
-    
-    QScrollBar::handle:vertical {{
+    }}""",
+    f"""QScrollBar::handle:vertical {{
         background-color: {COLORS["border"]};
         border-radius: 6px;
         min-height: 20px;
-    }}
-    
-    QScrollBar::handle:vertical:hover {{
+    }}""",
+    f"""QScrollBar::handle:vertical:hover {{
         background-color: {COLORS["text_muted"]};
-    }}
-    
-    QSplitter::handle {{
+    }}""",
+    f"""QSplitter::handle {{
         background-color: {COLORS["border"]};
-    }}
-"""
+    }}""",
+)
+
+# Joined once and interned: the same str object is applied to every window,
+# so Qt can skip re-parsing an identical sheet
+DARK_THEME = sys.intern("\n".join(_THEME_PARTS))
 
 
 def apply_dark_theme(widget):
-    """Apply the dark theme to a widget"""
+    """Apply the dark theme once per top-level window (children inherit it)"""
+    if widget.window() is not widget or widget.property("_ankiph_themed"):
+        return
     widget.setStyleSheet(DARK_THEME)
+    widget.setProperty("_ankiph_themed", True)
+
+
+# Inline button styles, built once at import
+_BUTTON_STYLES = {
+    "primary": f"background-color: {COLORS['btn_primary']}; font-weight: bold; padding: 10px 20px;",
+    "success": f"background-color: {COLORS['success']}; font-weight: bold; padding: 10px 20px; color: white;",
+    "warning": f"background-color: {COLORS['warning']}; font-weight: bold; padding: 10px 20px; color: white;",
+    "danger": f"background-color: {COLORS['error']}; font-weight: bold; padding: 10px 20px; color: white;",
+    "secondary": f"background-color: {COLORS['btn_secondary']}; padding: 8px 16px;",
+}
 
 
 def get_button_style(style_type: str = "secondary") -> str:
     """Get inline style for a button type"""
-    if style_type == "primary":
-        return f"background-color: {COLORS['btn_primary']}; font-weight: bold; padding: 10px 20px;"
-    elif style_type == "success":
-        return f"background-color: {COLORS['success']}; font-weight: bold; padding: 10px 20px; color: white;"
-    elif style_type == "warning":
-        return f"background-color: {COLORS['warning']}; font-weight: bold; padding: 10px 20px; color: white;"
-    elif style_type == "danger":
-        return f"background-color: {COLORS['error']}; font-weight: bold; padding: 10px 20px; color: white;"
-    else:
-        return f"background-color: {COLORS['btn_secondary']}; padding: 8px 16px;"
\ No newline at end of file
+    return _BUTTON_STYLES.get(style_type, _BUTTON_STYLES["secondary"])
@@ -6,7 +6,7 @@ Version: 4.0.0 - Refactored with shared styles
 
 from aqt.qt import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QMessageBox, Qt,
+    QListView, QMessageBox, Qt, QModelIndex, QTimer,
     QGroupBox, QTextEdit, QComboBox, QLineEdit,
     QFormLayout
 )
@@ -14,18 +14,28 @@ from aqt import mw
 
 from ..api_client import api, set_access_token, AnkiPHAPIError
 from ..config import config
+from ..utils import strip_html, strip_html_many
 from .styles import COLORS, apply_dark_theme
+from ..logger import logger
+from .components import TextListModel, SubstringFilterProxy, CloseAwareMixin
 
 
-class SuggestionDialog(QDialog):
+# Inline styles shared by both dialogs
+_TITLE_CSS = "font-size: 16px; font-weight: bold; padding: 10px;"
+_MUTED_CSS = "color: #666; padding: 5px;"
+
+
+class SuggestionDialog(CloseAwareMixin, QDialog):
     """Dialog for submitting card improvement suggestions"""
     
     def __init__(self, deck_id: str, card_guid: str, deck_name: str = "", parent=None):
         super().__init__(parent)
         self.deck_id = deck_id
         self.card_guid = card_guid
+        self._guid_short = card_guid[:16] + "..."
         self.deck_name = deck_name or f"Deck {deck_id[:8]}"
         self.current_fields = {}
+        self.cleaned_fields = {}  # HTML-stripped values for display
         
         self.setWindowTitle(f"Suggest Improvement")
         self.setMinimumSize(550, 500)
@@ -40,7 +50,7 @@ class SuggestionDialog(QDialog):
         
         # Title
         title = QLabel(f"💡 Submit Card Suggestion")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        title.setStyleSheet(_TITLE_CSS)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -49,7 +59,7 @@ class SuggestionDialog(QDialog):
             "Suggest an improvement to this card. Your suggestion will be reviewed\n"
             "by the deck maintainer and may be included in a future update."
         )
-        info.setStyleSheet("color: #666; padding: 5px;")
+        info.setStyleSheet(_MUTED_CSS)
         info.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(info)
         
@@ -60,7 +70,7 @@ class SuggestionDialog(QDialog):
         self.deck_label = QLabel(self.deck_name)
         card_layout.addRow("Deck:", self.deck_label)
         
-        self.guid_label = QLabel(self.card_guid[:16] + "...")
+        self.guid_label = QLabel(self._guid_short)
         card_layout.addRow("Card GUID:", self.guid_label)
         
         card_group.setLayout(card_layout)
@@ -82,7 +92,7 @@ class SuggestionDialog(QDialog):
         self.current_value_text = QTextEdit()
         self.current_value_text.setReadOnly(True)
         self.current_value_text.setMaximumHeight(80)
-        self.current_value_text.setStyleSheet("background-color: #f5f5f5;")
+        self.current_value_text.setProperty("role", "readonly")
         field_layout.addWidget(self.current_value_text)
         
         field_group.setLayout(field_layout)
@@ -114,16 +124,16 @@ class SuggestionDialog(QDialog):
         
         # Status
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666; font-size: 11px; padding: 5px;")
+        self.status_label.setProperty("class", "status")
         layout.addWidget(self.status_label)
         
         # Buttons
         button_layout = QHBoxLayout()
         
-        submit_btn = QPushButton("📤 Submit Suggestion")
-        submit_btn.setStyleSheet("padding: 10px; font-weight: bold; background-color: #4CAF50; color: white;")
-        submit_btn.clicked.connect(self.submit_suggestion)
-        button_layout.addWidget(submit_btn)
+        self.submit_btn = QPushButton("📤 Submit Suggestion")
+        self.submit_btn.setProperty("class", "submit")
+        self.submit_btn.clicked.connect(self.submit_suggestion)
+        button_layout.addWidget(self.submit_btn)
         
         button_layout.addStretch()
         
@@ -139,9 +149,10 @@ class SuggestionDialog(QDialog):
         """Load card fields from Anki"""
         self.field_combo.clear()
         self.current_fields = {}
+        self.cleaned_fields = {}
         
         # Get Anki deck ID
-        downloaded_decks = config.get_downloaded_decks()
+        downloaded_decks = config.get_downloaded_decks_cached()
         deck_info = downloaded_decks.get(self.deck_id, {})
         anki_deck_id = deck_info.get('anki_deck_id')
         
@@ -150,23 +161,28 @@ class SuggestionDialog(QDialog):
             return
         
         try:
-            # Find the card by GUID
-            note_id = mw.col.db.scalar(
-                "SELECT id FROM notes WHERE guid = ?", self.card_guid
+            # Find the note by GUID - raw fields and note type only, no Note object
+            row = mw.col.db.first(
+                "SELECT flds, mid FROM notes WHERE guid = ?", self.card_guid
             )
             
-            if not note_id:
+            if not row:
                 self.status_label.setText("❌ Card not found locally")
                 return
             
-            note = mw.col.get_note(note_id)
+            flds, mid = row
+            values = flds.split('\x1f')
             
-            # Get field names and values
-            model = note.note_type()
+            # Get field names and values; raw value, HTML-stripped value
+            # (so switching fields is a plain lookup) and combo item in one pass
+            model = mw.col.models.get(mid)
             field_names = [f['name'] for f in model['flds']]
+            value_count = len(values)
             
             for i, field_name in enumerate(field_names):
-                self.current_fields[field_name] = note.fields[i] if i < len(note.fields) else ""
+                value = values[i] if i < value_count else ""
+                self.current_fields[field_name] = value
+                self.cleaned_fields[field_name] = strip_html(value)
                 self.field_combo.addItem(field_name)
             
             self.status_label.setText(f"✓ Loaded {len(field_names)} fields")
@@ -177,17 +193,13 @@ class SuggestionDialog(QDialog):
                 
         except Exception as e:
             self.status_label.setText("❌ Failed to load card")
-            print(f"Error loading card fields: {e}")
+            logger.error(f"Error loading card fields: {e}")
     
     def on_field_selected(self, index):
         """Handle field selection"""
         field_name = self.field_combo.currentText()
-        if field_name in self.current_fields:
-            current_value = self.current_fields[field_name]
-            # Strip HTML for display
-            import re
-            clean_value = re.sub(r'<[^>]+>', '', current_value)
-            self.current_value_text.setText(clean_value)
+        if field_name in self.cleaned_fields:
+            self.current_value_text.setText(self.cleaned_fields[field_name])
     
     def submit_suggestion(self):
         """Submit the suggestion to server"""
@@ -215,16 +227,18 @@ class SuggestionDialog(QDialog):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        token = config.get_access_token()
+        token = config.get_access_token_cached()
         if not token:
             QMessageBox.warning(self, "Not Logged In", "Please login first.")
             return
         
         set_access_token(token)
         self.status_label.setText("⏳ Submitting suggestion...")
+        self.submit_btn.setEnabled(False)
         
-        try:
-            result = api.submit_suggestion(
+        # Network round-trip runs off the GUI thread; result handled on main
+        def _submit():
+            return api.submit_suggestion(
                 deck_id=self.deck_id,
                 card_guid=self.card_guid,
                 field_name=field_name,
@@ -232,6 +246,17 @@ class SuggestionDialog(QDialog):
                 suggested_value=suggested_value,
                 reason=reason
             )
+        
+        mw.taskman.run_in_background(_submit, self._on_submit_done)
+    
+    def _on_submit_done(self, future):
+        """Handle the submit_suggestion result (runs on the main thread)"""
+        if self._closed:
+            return
+        self.submit_btn.setEnabled(True)
+        
+        try:
+            result = future.result()
             
             if result.get('success'):
                 suggestion_id = result.get('suggestion_id', 'Unknown')
@@ -263,15 +288,21 @@ class SuggestionDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to submit suggestion:\n{str(e)}")
 
 
-class CardSuggestionBrowser(QDialog):
+class CardSuggestionBrowser(CloseAwareMixin, QDialog):
     """Browser to select a card and submit suggestion"""
     
+    _TITLE_FMT = "Suggest Card Improvement - {}"
+    
+    # Cards loaded before first paint, then per event-loop turn
+    FIRST_CHUNK_SIZE = 50
+    CHUNK_SIZE = 200
+    
     def __init__(self, deck_id: str, deck_name: str = "", parent=None):
         super().__init__(parent)
         self.deck_id = deck_id
         self.deck_name = deck_name or f"Deck {deck_id[:8]}"
         
-        self.setWindowTitle(f"Suggest Card Improvement - {self.deck_name}")
+        self.setWindowTitle(self._TITLE_FMT.format(self.deck_name))
         self.setMinimumSize(600, 400)
         self.setup_ui()
         apply_dark_theme(self)
@@ -283,7 +314,7 @@ class CardSuggestionBrowser(QDialog):
         
         # Title
         title = QLabel(f"💡 Select a Card to Suggest Improvement")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        title.setStyleSheet(_TITLE_CSS)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -292,7 +323,7 @@ class CardSuggestionBrowser(QDialog):
             f"Deck: {self.deck_name}\n\n"
             "Select a card to submit a suggestion for improvement."
         )
-        instructions.setStyleSheet("color: #666; padding: 5px;")
+        instructions.setStyleSheet(_MUTED_CSS)
         layout.addWidget(instructions)
         
         # Search
@@ -302,20 +333,35 @@ class CardSuggestionBrowser(QDialog):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search cards...")
-        self.search_input.textChanged.connect(self.filter_cards)
+        
+        # Debounce: restart on each keystroke, filter once typing pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.filter_cards)
+        self.search_input.textChanged.connect(lambda _text: self._filter_timer.start())
         search_layout.addWidget(self.search_input)
         
         layout.addLayout(search_layout)
         
-        # Card list
-        self.cards_list = QListWidget()
-        self.cards_list.setStyleSheet("QListWidget::item { padding: 10px; }")
-        self.cards_list.itemDoubleClicked.connect(self.open_suggestion_dialog)
+        # Card list (model/view - rows are rendered on demand)
+        self.cards_model = TextListModel(parent=self)
+        self.cards_proxy = SubstringFilterProxy(self)
+        self.cards_proxy.setSourceModel(self.cards_model)
+        
+        self.cards_list = QListView()
+        self.cards_list.setModel(self.cards_proxy)
+        # Single-line rows: let Qt size them all from one and lay out in batches
+        self.cards_list.setUniformItemSizes(True)
+        self.cards_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.cards_list.setBatchSize(50)
+        self.cards_list.setProperty("class", "roomy")
+        self.cards_list.doubleClicked.connect(self.open_suggestion_dialog)
         layout.addWidget(self.cards_list)
         
         # Status
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666; font-size: 11px;")
+        self.status_label.setProperty("class", "status")
         layout.addWidget(self.status_label)
         
         # Buttons
@@ -337,11 +383,12 @@ class CardSuggestionBrowser(QDialog):
     
     def load_cards(self):
         """Load cards from deck"""
-        self.cards_list.clear()
-        self.all_items = []
+        self.cards_model.clear()
+        self._card_ids = []
+        self._seen_guids = set()
         
         # Get Anki deck ID
-        downloaded_decks = config.get_downloaded_decks()
+        downloaded_decks = config.get_downloaded_decks_cached()
         deck_info = downloaded_decks.get(self.deck_id, {})
         anki_deck_id = deck_info.get('anki_deck_id')
         
@@ -357,64 +404,81 @@ class CardSuggestionBrowser(QDialog):
                 self.status_label.setText("No cards found in deck")
                 return
             
-            # Limit to first 100 cards for performance
-            display_count = min(len(card_ids), 100)
-            
-            for cid in card_ids[:display_count]:
-                try:
-                    card = mw.col.get_card(cid)
-                    note = card.note()
-                    
-                    # Get first field content for display
-                    first_field = ""
-                    if note.fields:
-                        first_field = note.fields[0][:50]
-                        # Strip HTML
-                        import re
-                        first_field = re.sub(r'<[^>]+>', '', first_field)
-                    
-                    guid = note.guid
-                    
-                    display_text = f"📄 {first_field}{'...' if len(note.fields[0]) > 50 else ''}"
-                    
-                    item = QListWidgetItem(display_text)
-                    item.setData(Qt.ItemDataRole.UserRole, guid)
-                    item.setToolTip(f"GUID: {guid}")
-                    
-                    self.cards_list.addItem(item)
-                    self.all_items.append((display_text, guid, item))
-                    
-                except Exception as e:
-                    print(f"Error loading card {cid}: {e}")
-                    continue
-            
-            if len(card_ids) > display_count:
-                self.status_label.setText(f"Showing {display_count} of {len(card_ids)} cards")
-            else:
-                self.status_label.setText(f"✓ Loaded {len(card_ids)} cards")
+            # First rows are painted right away, the rest arrive in chunks
+            self._card_ids = card_ids
+            self._load_chunk(card_ids, 0, self.FIRST_CHUNK_SIZE)
+        
+        except Exception as e:
+            self.status_label.setText("❌ Failed to load cards")
+            logger.error(f"Error loading cards: {e}")
+    
+    def _load_chunk(self, card_ids, offset: int, size: int = 0):
+        """Append one chunk of cards, then schedule the next on the event loop"""
+        # Dialog closed, stale chunk from a previous load, or collection closed meanwhile
+        if self._closed or card_ids is not self._card_ids or not mw.col:
+            return
         
+        chunk = card_ids[offset:offset + (size or self.CHUNK_SIZE)]
+        
+        try:
+            # Fetch GUID + raw fields for the whole chunk in one query
+            placeholders = ",".join("?" * len(chunk))
+            by_card = {
+                cid: (guid, flds) for cid, guid, flds in mw.col.db.all(
+                    f"SELECT c.id, n.guid, n.flds FROM cards c "
+                    f"JOIN notes n ON c.nid = n.id WHERE c.id IN ({placeholders})",
+                    *chunk
+                )
+            }
         except Exception as e:
             self.status_label.setText("❌ Failed to load cards")
-            print(f"Error loading cards: {e}")
+            logger.error(f"Error loading cards: {e}")
+            return
+        
+        # Keep the deck's card order; notes with several cards (possibly in
+        # different chunks) are listed once, at their first card
+        seen = self._seen_guids
+        rows = []
+        for cid in chunk:
+            row = by_card.get(cid)
+            if row and row[0] not in seen:
+                seen.add(row[0])
+                rows.append(row)
+        
+        # First field is everything before the first field separator. Only
+        # the first 51 characters are split: 50 for the preview, one more to
+        # tell whether it was cut, so long notes are never copied whole.
+        heads = [flds[:51].split('\x1f', 1)[0] for _, flds in rows]
+        previews = strip_html_many([head[:50] for head in heads])
+        
+        items = []
+        for (guid, _), head, first_field in zip(rows, heads, previews):
+            display_text = f"📄 {first_field}{'...' if len(head) > 50 else ''}"
+            items.append((display_text, guid, f"GUID: {guid}"))
+        
+        self.cards_model.append_rows(items)
+        
+        loaded = offset + len(chunk)
+        if loaded < len(card_ids):
+            self.status_label.setText(f"⏳ Loading cards... {loaded} of {len(card_ids)}")
+            QTimer.singleShot(0, lambda: self._load_chunk(card_ids, loaded))
+        else:
+            self.status_label.setText(f"✓ Loaded {len(card_ids)} cards")
     
     def filter_cards(self):
         """Filter cards based on search"""
-        query = self.search_input.text().lower()
-        
-        for display_text, guid, item in self.all_items:
-            matches = query in display_text.lower() or query in guid.lower()
-            item.setHidden(not matches)
+        self.cards_proxy.set_query(self.search_input.text())
     
-    def open_suggestion_dialog(self, item=None):
+    def open_suggestion_dialog(self, index=None):
         """Open suggestion dialog for selected card"""
-        if item is None:
-            item = self.cards_list.currentItem()
+        if not isinstance(index, QModelIndex):
+            index = self.cards_list.currentIndex()
         
-        if not item:
+        if not index.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a card.")
             return
         
-        card_guid = item.data(Qt.ItemDataRole.UserRole)
+        card_guid = index.data(Qt.ItemDataRole.UserRole)
         if not card_guid:
             QMessageBox.warning(self, "Error", "Could not get card GUID.")
             return
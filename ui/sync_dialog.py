@@ -6,7 +6,7 @@ Version: 4.0.0 - Refactored with shared styles
 
 from aqt.qt import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QMessageBox, Qt,
+    QListView, QMessageBox, Qt,
     QTabWidget, QWidget, QGroupBox, QRadioButton,
     QButtonGroup, QTextEdit, QSplitter, QFrame,
     QProgressBar
@@ -17,11 +17,50 @@ from datetime import datetime
 from ..api_client import api, set_access_token, AnkiPHAPIError
 from ..config import config
 from .styles import COLORS, apply_dark_theme
+from ..logger import logger
+from .components import TextListModel, LazyTabsMixin, CloseAwareMixin
 
 
-class SyncDialog(QDialog):
+# Pull list row icon per change_type (anything else is shown as a delete)
+_CHANGE_ICONS = {"modify": "📝", "add": "➕", "delete": "🗑️"}
+
+# "<icon> <guid prefix> - <field>" row text, bound once for the fill loops
+_ROW_FMT = "{} {} - {}".format
+
+
+def _make_details_label():
+    """Selectable plain-text label for the short change summaries"""
+    label = QLabel()
+    label.setProperty("class", "details")
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+    label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+    label.setWordWrap(True)
+    label.setMinimumHeight(60)
+    label.setMaximumHeight(100)
+    return label
+
+
+def _make_list_view(model, row_class=None):
+    """Create a QListView over a TextListModel (rows are rendered on demand)"""
+    view = QListView()
+    view.setModel(model)
+    # Single-line rows: let Qt size them all from one
+    view.setUniformItemSizes(True)
+    # Row padding comes from the shared theme ("compact"/"roomy"), not a per-view sheet
+    if row_class:
+        view.setProperty("class", row_class)
+    return view
+
+
+class SyncDialog(LazyTabsMixin, CloseAwareMixin, QDialog):
     """Dialog for syncing changes with server"""
     
+    # Tab indices
+    PULL_TAB = 0
+    PUSH_TAB = 1
+    CONFLICTS_TAB = 2
+    
     def __init__(self, deck_id: str, deck_name: str = "", parent=None):
         super().__init__(parent)
         self.deck_id = deck_id
@@ -29,6 +68,12 @@ class SyncDialog(QDialog):
         self.pending_changes = []
         self.conflicts = []
         self.sync_in_progress = False
+        self._dirty_tabs = set()  # Tabs whose list is stale since the last check
+        self._protected_fields = None  # Cached per check; see _get_protected_fields
+        self._field_index_cache = {}  # note type id -> {field name: index}
+        self._last_apply_error = None  # Message for the last failed change
+        self._last_applied_changes = []  # Change dicts saved by the last batch
+        self._last_result_key = None  # Identity of the listed pull_changes result
         
         self.setWindowTitle(f"Sync - {self.deck_name}")
         self.setMinimumSize(700, 550)
@@ -54,13 +99,20 @@ class SyncDialog(QDialog):
         # Tab widget for Push/Pull
         self.tabs = QTabWidget()
         
+        # Push and Conflicts start as empty containers; their widgets are
+        # built the first time the tab is shown (see _ensure_tab_built)
         self.pull_tab = self.create_pull_tab()
-        self.push_tab = self.create_push_tab()
-        self.conflicts_tab = self.create_conflicts_tab()
+        self.push_tab = self._create_tab_container()
+        self.conflicts_tab = self._create_tab_container()
+        self._tab_builders = {
+            self.PUSH_TAB: self.create_push_tab,
+            self.CONFLICTS_TAB: self.create_conflicts_tab,
+        }
         
         self.tabs.addTab(self.pull_tab, "⬇️ Pull Changes")
         self.tabs.addTab(self.push_tab, "⬆️ Push Changes")
         self.tabs.addTab(self.conflicts_tab, "⚠️ Conflicts (0)")
+        self.tabs.currentChanged.connect(self._ensure_tab_populated)
         
         layout.addWidget(self.tabs)
         
@@ -72,9 +124,9 @@ class SyncDialog(QDialog):
         # Bottom buttons
         button_layout = QHBoxLayout()
         
-        refresh_btn = QPushButton("🔄 Check for Changes")
-        refresh_btn.clicked.connect(self.check_for_changes)
-        button_layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("🔄 Check for Changes")
+        self.refresh_btn.clicked.connect(self.check_for_changes)
+        button_layout.addWidget(self.refresh_btn)
         
         button_layout.addStretch()
         
@@ -104,17 +156,15 @@ class SyncDialog(QDialog):
         layout.addWidget(instructions)
         
         # Changes list
-        self.pull_changes_list = QListWidget()
-        self.pull_changes_list.setStyleSheet("QListWidget::item { padding: 8px; }")
-        self.pull_changes_list.itemClicked.connect(self.show_pull_change_details)
+        self.pull_model = TextListModel(parent=self)
+        self.pull_changes_list = _make_list_view(self.pull_model)
+        self.pull_changes_list.clicked.connect(self.show_pull_change_details)
         layout.addWidget(self.pull_changes_list)
         
         # Details panel
         details_group = QGroupBox("Change Details")
         details_layout = QVBoxLayout()
-        self.pull_details_text = QTextEdit()
-        self.pull_details_text.setReadOnly(True)
-        self.pull_details_text.setMaximumHeight(100)
+        self.pull_details_text = _make_details_label()
         details_layout.addWidget(self.pull_details_text)
         details_group.setLayout(details_layout)
         layout.addWidget(details_group)
@@ -152,17 +202,15 @@ class SyncDialog(QDialog):
         layout.addWidget(instructions)
         
         # Changes list
-        self.push_changes_list = QListWidget()
-        self.push_changes_list.setStyleSheet("QListWidget::item { padding: 8px; }")
-        self.push_changes_list.itemClicked.connect(self.show_push_change_details)
+        self.push_model = TextListModel(parent=self, foreground=Qt.GlobalColor.gray)
+        self.push_changes_list = _make_list_view(self.push_model)
+        self.push_changes_list.clicked.connect(self.show_push_change_details)
         layout.addWidget(self.push_changes_list)
         
         # Details panel
         details_group = QGroupBox("Change Details")
         details_layout = QVBoxLayout()
-        self.push_details_text = QTextEdit()
-        self.push_details_text.setReadOnly(True)
-        self.push_details_text.setMaximumHeight(100)
+        self.push_details_text = _make_details_label()
         details_layout.addWidget(self.push_details_text)
         details_group.setLayout(details_layout)
         layout.addWidget(details_group)
@@ -200,9 +248,9 @@ class SyncDialog(QDialog):
         layout.addWidget(instructions)
         
         # Conflicts list
-        self.conflicts_list = QListWidget()
-        self.conflicts_list.setStyleSheet("QListWidget::item { padding: 10px; }")
-        self.conflicts_list.itemClicked.connect(self.show_conflict_details)
+        self.conflicts_model = TextListModel(parent=self, foreground=Qt.GlobalColor.darkYellow)
+        self.conflicts_list = _make_list_view(self.conflicts_model, "roomy")
+        self.conflicts_list.clicked.connect(self.show_conflict_details)
         layout.addWidget(self.conflicts_list)
         
         # Conflict resolution panel
@@ -288,7 +336,10 @@ class SyncDialog(QDialog):
     
     def check_for_changes(self):
         """Check for pending changes from server"""
-        token = config.get_access_token()
+        if self.sync_in_progress:
+            return
+        
+        token = config.get_access_token_cached()
         if not token:
             self.status_label.setText("❌ Not logged in")
             return
@@ -297,68 +348,66 @@ class SyncDialog(QDialog):
         self.status_label.setText("⏳ Checking for changes...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
+        self.refresh_btn.setEnabled(False)
+        self.sync_in_progress = True
+        
+        # Settings or note types may have changed since the last check
+        self._protected_fields = None
+        self._field_index_cache.clear()
+        
+        # Get sync state
+        sync_state = config.get_sync_state(self.deck_id)
+        last_sync = sync_state.get('last_change_id') or sync_state.get('last_sync')
+        
+        # Network round-trip runs off the GUI thread; result handled on main
+        mw.taskman.run_in_background(
+            lambda: api.pull_changes(deck_id=self.deck_id, since=last_sync),
+            self._on_changes_received
+        )
+    
+    def _on_changes_received(self, future):
+        """Handle the pull_changes result (runs on the main thread)"""
+        self.sync_in_progress = False
+        if self._closed:
+            return
+        self.refresh_btn.setEnabled(True)
         
         try:
-            # Get sync state
-            sync_state = config.get_sync_state(self.deck_id)
-            last_sync = sync_state.get('last_change_id') or sync_state.get('last_sync')
-            
-            # Pull changes from server
-            result = api.pull_changes(
-                deck_id=self.deck_id,
-                since=last_sync
-            )
+            result = future.result()
             
             if not result.get('success'):
                 self.status_label.setText("❌ Failed to check for changes")
-                self.progress_bar.setVisible(False)
                 return
             
             # Process changes
-            changes = result.get('changes', [])
-            self.conflicts = result.get('conflicts', [])
+            # Malformed entries are dropped here, once, so every list consumer
+            # can rely on rows holding change dicts
+            changes = [c for c in result.get('changes', []) if isinstance(c, dict)]
+            conflicts = [c for c in result.get('conflicts', []) if isinstance(c, dict)]
             
-            # Update pull list
-            self.pull_changes_list.clear()
-            for change in changes:
-                card_guid = change.get('card_guid', 'Unknown')
-                field_name = change.get('field_name', 'Unknown')
-                change_type = change.get('change_type', 'modify')
-                
-                icon = "📝" if change_type == "modify" else "➕" if change_type == "add" else "🗑️"
-                display_text = f"{icon} {card_guid[:8]} - {field_name}"
-                
-                item = QListWidgetItem(display_text)
-                item.setData(Qt.ItemDataRole.UserRole, change)
-                self.pull_changes_list.addItem(item)
-            
-            # Update conflicts list
-            self.conflicts_list.clear()
-            for conflict in self.conflicts:
-                card_guid = conflict.get('card_guid', 'Unknown')
-                field_name = conflict.get('field_name', 'Unknown')
-                
-                display_text = f"⚠️ {card_guid[:8]} - {field_name}"
+            # A poll that returns what is already listed needs no refill
+            result_key = (
+                tuple((c.get('change_id'), c.get('card_guid'), c.get('field_name')) for c in changes),
+                tuple((c.get('card_guid'), c.get('field_name'), c.get('server_value')) for c in conflicts),
+            )
+            if result_key != self._last_result_key:
+                self._last_result_key = result_key
+                self.pending_changes = changes
+                self.conflicts = conflicts
                 
-                item = QListWidgetItem(display_text)
-                item.setData(Qt.ItemDataRole.UserRole, conflict)
-                item.setForeground(Qt.GlobalColor.darkYellow)
-                self.conflicts_list.addItem(item)
+                # Only the visible tab's list is filled now; the others are
+                # filled when the user switches to them
+                self._dirty_tabs = {self.PULL_TAB, self.PUSH_TAB, self.CONFLICTS_TAB}
+                self._ensure_tab_populated(self.tabs.currentIndex())
             
             # Update tab label
             self.tabs.setTabText(2, f"⚠️ Conflicts ({len(self.conflicts)})")
             
             # Status
             self.status_label.setText(
-                f"✓ Found {len(changes)} change(s), {len(self.conflicts)} conflict(s)"
+                f"✓ Found {len(changes)} change(s), {len(conflicts)} conflict(s)"
             )
             
-            # Check for local changes to push (placeholder - would need to track local edits)
-            self.push_changes_list.clear()
-            item = QListWidgetItem("📝 Local change tracking coming soon")
-            item.setForeground(Qt.GlobalColor.gray)
-            self.push_changes_list.addItem(item)
-            
         except AnkiPHAPIError as e:
             error_msg = str(e)
             if e.status_code == 401:
@@ -368,16 +417,52 @@ class SyncDialog(QDialog):
         
         except Exception as e:
             self.status_label.setText("❌ Error checking changes")
-            print(f"Error checking changes: {e}")
+            logger.error(f"Error checking changes: {e}")
         
         finally:
             self.progress_bar.setVisible(False)
     
-    def show_pull_change_details(self, item):
-        """Show details for selected pull change"""
-        change = item.data(Qt.ItemDataRole.UserRole)
-        if not change or not isinstance(change, dict):
+    def _ensure_tab_populated(self, index):
+        """Build a tab if needed and fill its list if stale since the last check"""
+        self._ensure_tab_built(index)
+        if index not in self._dirty_tabs:
             return
+        self._dirty_tabs.discard(index)
+        
+        if index == self.PULL_TAB:
+            self._populate_pull_list()
+        elif index == self.PUSH_TAB:
+            self._populate_push_list()
+        elif index == self.CONFLICTS_TAB:
+            self._populate_conflicts_list()
+    
+    def _populate_pull_list(self):
+        """Fill the pull list from self.pending_changes"""
+        icon_for = _CHANGE_ICONS.get
+        fmt = _ROW_FMT
+        self.pull_model.set_rows([
+            (fmt(icon_for(c.get('change_type', 'modify'), "🗑️"),
+                 c.get('card_guid', 'Unknown')[:8],
+                 c.get('field_name', 'Unknown')), c)
+            for c in self.pending_changes
+        ])
+    
+    def _populate_conflicts_list(self):
+        """Fill the conflicts list from self.conflicts"""
+        fmt = _ROW_FMT
+        self.conflicts_model.set_rows([
+            (fmt("⚠️", c.get('card_guid', 'Unknown')[:8], c.get('field_name', 'Unknown')), c)
+            for c in self.conflicts
+        ])
+    
+    def _populate_push_list(self):
+        """Fill the push list"""
+        # Check for local changes to push (placeholder - would need to track local edits)
+        self.push_model.set_rows([("📝 Local change tracking coming soon", None)])
+    
+    def show_pull_change_details(self, index):
+        """Show details for selected pull change"""
+        change = index.data(Qt.ItemDataRole.UserRole)
         
         details = (
             f"Card: {change.get('card_guid', 'Unknown')}\n"
@@ -388,10 +473,10 @@ class SyncDialog(QDialog):
         )
         self.pull_details_text.setText(details)
     
-    def show_push_change_details(self, item):
+    def show_push_change_details(self, index):
         """Show details for selected push change"""
-        change = item.data(Qt.ItemDataRole.UserRole)
-        if not change or not isinstance(change, dict):
+        change = index.data(Qt.ItemDataRole.UserRole)
+        if not change:  # Placeholder row
             self.push_details_text.setText("No details available")
             return
         
@@ -402,24 +487,23 @@ class SyncDialog(QDialog):
         )
         self.push_details_text.setText(details)
     
-    def show_conflict_details(self, item):
+    def show_conflict_details(self, index):
         """Show details for selected conflict"""
-        conflict = item.data(Qt.ItemDataRole.UserRole)
-        if not conflict or not isinstance(conflict, dict):
-            return
+        conflict = index.data(Qt.ItemDataRole.UserRole)
         
         self.local_text.setText(conflict.get('local_value', 'Unknown'))
         self.server_text.setText(conflict.get('server_value', 'Unknown'))
     
     def pull_all_changes(self):
         """Pull all changes from server"""
-        if self.pull_changes_list.count() == 0:
+        self._ensure_tab_populated(self.PULL_TAB)
+        if self.pull_model.rowCount() == 0:
             QMessageBox.information(self, "No Changes", "No changes to pull.")
             return
         
         reply = QMessageBox.question(
             self, "Confirm Pull",
-            f"Apply all {self.pull_changes_list.count()} changes from server?\n\n"
+            f"Apply all {self.pull_model.rowCount()} changes from server?\n\n"
             "This will update your local cards with server versions.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
@@ -429,23 +513,22 @@ class SyncDialog(QDialog):
     
     def pull_selected_change(self):
         """Pull selected change"""
-        current = self.pull_changes_list.currentItem()
-        if not current:
+        current = self.pull_changes_list.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a change to pull.")
             return
         
         change = current.data(Qt.ItemDataRole.UserRole)
-        if not change or not isinstance(change, dict):
-            QMessageBox.warning(self, "Error", "Could not read change data.")
-            return
         
         # Apply single change using same logic as _apply_pulled_changes
         result = self._apply_single_change(change)
         
         if result == "applied":
             # Remove from list
-            row = self.pull_changes_list.row(current)
-            self.pull_changes_list.takeItem(row)
+            row = current.row()
+            del self.pending_changes[row]
+            self.pull_model.remove_at(row)
+            self._last_result_key = None
             self.status_label.setText("✓ Change applied")
         elif result == "protected":
             QMessageBox.warning(self, "Protected Field", "This field is protected and cannot be overwritten.")
@@ -459,76 +542,88 @@ class SyncDialog(QDialog):
         if not mw.col:
             return "Collection not available"
         
-        card_guid = change.get('card_guid')
-        field_name = change.get('field_name')
-        new_value = change.get('new_value', '')
-        
-        if not card_guid or not field_name:
+        if not change.get('card_guid') or not change.get('field_name'):
             return "Invalid change data"
         
-        # Check if field is protected
-        protected_fields = config.get_protected_fields(self.deck_id)
-        if field_name in protected_fields:
+        applied, protected, not_found, _errors, _ = self._apply_changes_batch([change])
+        if applied:
+            return "applied"
+        if protected:
             return "protected"
-        
-        try:
-            note_id = mw.col.db.scalar("SELECT id FROM notes WHERE guid = ?", card_guid)
-            if not note_id:
-                return "not_found"
-            
-            note = mw.col.get_note(note_id)
+        if not_found:
+            return "not_found"
+        return self._last_apply_error or "Failed to apply change"
+    
+    def _get_protected_fields(self) -> frozenset:
+        """Protected field names for this deck, read from config once per check"""
+        if self._protected_fields is None:
+            # Hashed for O(1) membership; frozen since every caller shares it
+            self._protected_fields = frozenset(config.get_protected_fields(self.deck_id))
+        return self._protected_fields
+    
+    def _field_index(self, note, field_name: str):
+        """Index of field_name in the note's type, or None (map cached per note type)"""
+        field_map = self._field_index_cache.get(note.mid)
+        if field_map is None:
             model = note.note_type()
-            field_names = [f['name'] for f in model['flds']]
-            
-            if field_name not in field_names:
-                return f"Field '{field_name}' not found"
-            
-            field_index = field_names.index(field_name)
-            note.fields[field_index] = new_value
-            mw.col.update_note(note)
-            
-            print(f"✓ Applied change to {card_guid[:12]}...")
-            return "applied"
-            
-        except Exception as e:
-            return str(e)
+            field_map = {f['name']: idx for idx, f in enumerate(model['flds'])}
+            self._field_index_cache[note.mid] = field_map
+        return field_map.get(field_name)
     
-    def _apply_pulled_changes(self):
-        """Apply pulled changes to local cards"""
-        if not mw.col:
-            QMessageBox.critical(self, "Error", "Anki collection not available.")
-            return
-        
-        self.status_label.setText("⏳ Applying changes...")
-        self.progress_bar.setVisible(True)
+    def _lookup_note_ids(self, guids) -> dict:
+        """Map card GUIDs to local note ids with chunked IN queries"""
+        unique = list({g for g in guids if g})
+        guid_to_nid = {}
+        # Chunk to stay under SQLite's 999 variable limit
+        chunk_size = 999
+        
+        for i in range(0, len(unique), chunk_size):
+            chunk = unique[i:i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            rows = mw.col.db.all(
+                f"SELECT guid, id FROM notes WHERE guid IN ({placeholders})", *chunk
+            )
+            guid_to_nid.update(rows)
         
-        # Get protected fields for this deck
-        protected_fields = config.get_protected_fields(self.deck_id)
+        return guid_to_nid
+    
+    def _apply_changes_batch(self, changes):
+        """
+        Apply field changes to local notes in one pass.
         
-        # Collect all changes from the list
-        changes_to_apply = []
-        for i in range(self.pull_changes_list.count()):
-            item = self.pull_changes_list.item(i)
-            change = item.data(Qt.ItemDataRole.UserRole)
-            if change and isinstance(change, dict):
-                changes_to_apply.append(change)
+        GUIDs are resolved with one bulk query and all edited notes are saved
+        with a single update_notes call (one transaction, one undo entry).
         
-        if not changes_to_apply:
-            self.status_label.setText("No changes to apply")
-            self.progress_bar.setVisible(False)
-            return
-        
-        # Track results
+        Returns:
+            (applied, protected, not_found, errors, last_change_id)
+        """
         applied_count = 0
         skipped_protected = 0
         not_found = 0
         errors = 0
         last_change_id = None
+        applied_changes = []
+        self._last_apply_error = None
         
-        self.progress_bar.setRange(0, len(changes_to_apply))
+        protected_fields = self._get_protected_fields()
+        
+        # Resolve every GUID to a note id up front instead of one query per change
+        guid_to_nid = self._lookup_note_ids(c.get('card_guid') for c in changes)
+        # Edited notes by id, saved together after the loop. Several changes
+        # to one note share the same Note object so no edit is lost.
+        dirty_notes = {}
         
-        for i, change in enumerate(changes_to_apply):
-            self.progress_bar.setValue(i + 1)
+        # Per-change outcomes are summarized in one print after the loop
+        skipped_fields = set()
+        missing_fields = set()
+        
+        # Move the progress bar ~100 times in total, not once per change
+        total = len(changes)
+        tick = max(1, total // 100)
+        
+        for i, change in enumerate(changes):
+            if i % tick == 0 or i == total - 1:
+                self.progress_bar.setValue(i + 1)
             
             card_guid = change.get('card_guid')
             field_name = change.get('field_name')
@@ -542,49 +637,83 @@ class SyncDialog(QDialog):
             # Check if field is protected
             if field_name in protected_fields:
                 skipped_protected += 1
-                print(f"⚠ Skipping protected field: {field_name}")
+                skipped_fields.add(field_name)
                 continue
             
             try:
-                # Find the note by GUID (same pattern as suggestion_dialog.py)
-                note_id = mw.col.db.scalar(
-                    "SELECT id FROM notes WHERE guid = ?", card_guid
-                )
+                note_id = guid_to_nid.get(card_guid)
                 
                 if not note_id:
                     not_found += 1
-                    print(f"⚠ Note not found locally: {card_guid[:12]}...")
                     continue
                 
-                note = mw.col.get_note(note_id)
+                note = dirty_notes.get(note_id)
+                if note is None:
+                    note = mw.col.get_note(note_id)
                 
                 # Get field index by name
-                model = note.note_type()
-                field_names = [f['name'] for f in model['flds']]
-                
-                if field_name not in field_names:
-                    print(f"⚠ Field '{field_name}' not found in note type")
+                field_index = self._field_index(note, field_name)
+                if field_index is None:
+                    missing_fields.add(field_name)
+                    self._last_apply_error = f"Field '{field_name}' not found"
                     errors += 1
                     continue
                 
-                field_index = field_names.index(field_name)
-                
-                # Update the field value
+                # Update the field value (saved with the rest below)
                 note.fields[field_index] = new_value
-                
-                # Save the note
-                mw.col.update_note(note)
+                dirty_notes[note_id] = note
                 
                 applied_count += 1
+                applied_changes.append(change)
                 if change_id:
                     last_change_id = change_id
                 
-                print(f"✓ Updated {card_guid[:12]}... field '{field_name}'")
-                
             except Exception as e:
                 errors += 1
+                self._last_apply_error = str(e)
                 print(f"✗ Error updating {card_guid[:12]}...: {e}")
         
+        if dirty_notes:
+            try:
+                mw.col.update_notes(list(dirty_notes.values()))
+            except Exception as e:
+                print(f"✗ Error saving changes: {e}")
+                self._last_apply_error = str(e)
+                errors += applied_count
+                applied_count = 0
+                applied_changes = []
+                last_change_id = None
+        
+        print(f"✓ Applied {applied_count}/{total} change(s), {not_found} not found locally")
+        if skipped_fields:
+            print(f"⚠ Skipped protected field(s): {', '.join(sorted(skipped_fields))}")
+        if missing_fields:
+            print(f"⚠ Field(s) not in note type: {', '.join(sorted(missing_fields))}")
+        
+        self._last_applied_changes = applied_changes
+        return applied_count, skipped_protected, not_found, errors, last_change_id
+    
+    def _apply_pulled_changes(self):
+        """Apply pulled changes to local cards"""
+        if not mw.col:
+            QMessageBox.critical(self, "Error", "Anki collection not available.")
+            return
+        
+        self.status_label.setText("⏳ Applying changes...")
+        self.progress_bar.setVisible(True)
+        
+        # Collect all changes from the list
+        changes_to_apply = self.pull_model.row_data()
+        
+        if not changes_to_apply:
+            self.status_label.setText("No changes to apply")
+            self.progress_bar.setVisible(False)
+            return
+        
+        self.progress_bar.setRange(0, len(changes_to_apply))
+        (applied_count, skipped_protected, not_found,
+         errors, last_change_id) = self._apply_changes_batch(changes_to_apply)
+        
         # Update sync state
         sync_data = {
             'last_sync': datetime.now().isoformat(),
@@ -597,6 +726,14 @@ class SyncDialog(QDialog):
         
         self.progress_bar.setVisible(False)
         
+        # Drop applied rows locally instead of re-fetching from the server;
+        # "Check for Changes" still does a full refresh on demand
+        applied_ids = {id(c) for c in self._last_applied_changes}
+        if applied_ids:
+            self.pending_changes = [c for c in self.pending_changes if id(c) not in applied_ids]
+            self._populate_pull_list()
+            self._last_result_key = None
+        
         # Show summary
         summary = f"✓ Applied {applied_count} change(s)"
         details = []
@@ -621,9 +758,6 @@ class SyncDialog(QDialog):
             f"• Not found locally: {not_found}\n"
             f"• Errors: {errors}"
         )
-        
-        # Refresh
-        self.check_for_changes()
     
     def push_all_changes(self):
         """Push all local changes to server"""
@@ -644,14 +778,12 @@ class SyncDialog(QDialog):
     
     def resolve_selected_conflict(self):
         """Resolve the currently selected conflict"""
-        current = self.conflicts_list.currentItem()
-        if not current:
+        current = self.conflicts_list.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a conflict to resolve.")
             return
         
         conflict = current.data(Qt.ItemDataRole.UserRole)
-        if not conflict:
-            return
         
         # Get resolution choice
         resolution_id = self.resolution_group.checkedId()
@@ -675,11 +807,13 @@ class SyncDialog(QDialog):
         resolution = "local" if keep_local else "server"
         
         # Remove from list
-        row = self.conflicts_list.row(current)
-        self.conflicts_list.takeItem(row)
+        row = current.row()
+        del self.conflicts[row]
+        self.conflicts_model.remove_at(row)
+        self._last_result_key = None
         
         # Update tab label
-        remaining = self.conflicts_list.count()
+        remaining = self.conflicts_model.rowCount()
         self.tabs.setTabText(2, f"⚠️ Conflicts ({remaining})")
         
         self.status_label.setText(f"✓ Conflict resolved (kept {resolution})")
@@ -689,7 +823,8 @@ class SyncDialog(QDialog):
     
     def resolve_all_conflicts(self, resolution: str):
         """Resolve all conflicts with same resolution"""
-        count = self.conflicts_list.count()
+        self._ensure_tab_populated(self.CONFLICTS_TAB)
+        count = self.conflicts_model.rowCount()
         if count == 0:
             QMessageBox.information(self, "No Conflicts", "No conflicts to resolve.")
             return
@@ -704,32 +839,28 @@ class SyncDialog(QDialog):
             return
         
         # Apply resolutions
-        applied = 0
-        errors = 0
+        conflicts = self.conflicts_model.row_data()
         
-        for i in range(self.conflicts_list.count()):
-            item = self.conflicts_list.item(i)
-            conflict = item.data(Qt.ItemDataRole.UserRole)
-            if not conflict:
-                continue
-            
-            if resolution == "server":
-                # Apply server version
-                change_to_apply = {
-                    'card_guid': conflict.get('card_guid'),
-                    'field_name': conflict.get('field_name'),
-                    'new_value': conflict.get('server_value', '')
-                }
-                result = self._apply_single_change(change_to_apply)
-                if result == "applied":
-                    applied += 1
-                else:
-                    errors += 1
-            else:
-                # Keep local - no action needed
-                applied += 1
+        if resolution == "server":
+            if not mw.col:
+                QMessageBox.critical(self, "Error", "Anki collection not available.")
+                return
+            # Apply all server versions as one batch
+            changes = [{
+                'card_guid': c.get('card_guid'),
+                'field_name': c.get('field_name'),
+                'new_value': c.get('server_value', '')
+            } for c in conflicts]
+            applied, protected, not_found, errors, _ = self._apply_changes_batch(changes)
+            errors += protected + not_found
+        else:
+            # Keep local - no action needed
+            applied = len(conflicts)
+            errors = 0
         
-        self.conflicts_list.clear()
+        self.conflicts = []
+        self.conflicts_model.clear()
+        self._last_result_key = None
         self.tabs.setTabText(2, "⚠️ Conflicts (0)")
         self.status_label.setText(f"✓ All conflicts resolved (kept {resolution})")
         
@@ -5,6 +5,8 @@ Version: 4.0.0 - Fixed token expiry handling
 """
 
 import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
 from aqt import mw
 from aqt.utils import showInfo, tooltip
 from datetime import datetime, timedelta
@@ -12,6 +14,7 @@ from typing import Dict, List, Optional
 from .api_client import api, AnkiPHAPIError, set_access_token, ensure_valid_token
 from .config import config
 from .logger import logger
+from .constants import AUTO_UPDATE_MAX_WORKERS
 
 
 def _safe_tooltip(msg: str, period: int = 3000):
@@ -19,6 +22,25 @@ def _safe_tooltip(msg: str, period: int = 3000):
     mw.taskman.run_on_main(lambda: tooltip(msg, period=period))
 
 
+def _iter_completed_bounded(executor, fn, keys, window: int):
+    """
+    Yield (key, future) as fn(key) calls complete, keeping at most `window`
+    results submitted but not yet consumed. The next key is only submitted
+    once the caller is done with a completed one, so peak memory scales with
+    the window rather than the number of keys.
+    """
+    keys = iter(keys)
+    pending = {executor.submit(fn, key): key for key in islice(keys, window)}
+    
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            key = pending.pop(future)
+            yield key, future
+            for next_key in islice(keys, 1):
+                pending[executor.submit(fn, next_key)] = next_key
+
+
 class UpdateChecker:
     """Handles checking for deck updates"""
     
@@ -175,16 +197,18 @@ class UpdateChecker:
         # Build message
         lines = ["Available Updates:\n"]
         
+        # Read tracked decks once, not once per update
+        downloaded_ids = config.get_downloaded_decks().keys()
+        
         for deck_id, update_info in updates_dict.items():
             current = update_info.get('current_version', 'Unknown')
             latest = update_info.get('latest_version', 'Unknown')
             summary = update_info.get('changelog_summary', '')
             
             # Try to get deck name from downloaded decks
-            downloaded = config.get_downloaded_decks()
             deck_name = "Unknown Deck"
             
-            if deck_id in downloaded:
+            if deck_id in downloaded_ids:
                 # We don't have the name in config, just use ID
                 deck_name = f"Deck {deck_id[:8]}"
             
@@ -257,7 +281,7 @@ class UpdateChecker:
                 return None
             
             # Set access token
-            token = config.get_access_token()
+            token = config.get_access_token_cached()
             set_access_token(token)
             
             # Call API
@@ -289,6 +313,9 @@ class UpdateChecker:
         """
         Automatically download and apply all available updates.
         Called on startup for hands-off sync experience.
+        
+        Downloads run concurrently on a small thread pool (network-bound);
+        each import runs on the calling thread as its download completes.
         """
         updates = config.get_available_updates()
         
@@ -301,78 +328,90 @@ class UpdateChecker:
         # Import locally to avoid circular dependency at module level
         from .deck_importer import import_deck_from_json
         
+        # Refresh token once up front - all downloads share it
+        refresh_token = config.get_refresh_token()
+        if refresh_token:
+            try:
+                result = api.refresh_access_token(refresh_token)
+                if result.get('success'):
+                    new_token = result.get('access_token')
+                    new_refresh = result.get('refresh_token', refresh_token)
+                    expires_at = result.get('expires_at')
+                    
+                    if new_token:
+                        config.save_tokens(new_token, new_refresh, expires_at)
+                        set_access_token(new_token)
+            except Exception as e:
+                logger.warning(f"Token refresh failed during auto-update: {e}")
+        
+        # Set access token
+        token = config.get_access_token_cached()
+        if not token:
+            logger.error("No access token available for auto-update")
+            logger.warning(f"{len(updates)} deck(s) failed to auto-update")
+            return
+        
+        set_access_token(token)
+        
         success_count = 0
         fail_count = 0
+        updated_ids = []  # Update notifications cleared in one write at the end
         
-        for deck_id, update_info in updates.items():
-            try:
-                # Refresh token before each download
-                refresh_token = config.get_refresh_token()
-                if refresh_token:
-                    try:
-                        result = api.refresh_access_token(refresh_token)
-                        if result.get('success'):
-                            new_token = result.get('access_token')
-                            new_refresh = result.get('refresh_token', refresh_token)
-                            expires_at = result.get('expires_at')
-                            
-                            if new_token:
-                                config.save_tokens(new_token, new_refresh, expires_at)
-                                set_access_token(new_token)
-                    except Exception as e:
-                        logger.warning(f"Token refresh failed during auto-update: {e}")
-                
-                # Set access token
-                token = config.get_access_token()
-                if not token:
-                    logger.error("No access token available for auto-update")
-                    fail_count += 1
-                    continue
-                
-                set_access_token(token)
-                
-                # Get deck data (JSON) directly
-                result = api.download_deck(deck_id)
+        with ThreadPoolExecutor(max_workers=min(AUTO_UPDATE_MAX_WORKERS, len(updates))) as executor:
+            # Get deck data (JSON) in parallel, holding at most one pool's
+            # worth of downloaded-but-not-imported payloads at a time
+            completed = _iter_completed_bounded(
+                executor, api.download_deck, updates, AUTO_UPDATE_MAX_WORKERS
+            )
+            
+            for deck_id, future in completed:
+                update_info = updates[deck_id]
                 
-                if not result.get('success'):
-                    logger.error(f"Failed to get deck data for {deck_id}: {result.get('error', 'Unknown error')}")
+                try:
+                    result = future.result()
+                    
+                    if not result.get('success'):
+                        logger.error(f"Failed to get deck data for {deck_id}: {result.get('error', 'Unknown error')}")
+                        fail_count += 1
+                        continue
+                    
+                    # Import the deck (synchronous for background operation)
+                    deck_name = update_info.get('title') or f"Update_{deck_id[:8]}"
+                    logger.info(f"Syncing deck {deck_name}...")
+                    
+                    anki_deck_id = import_deck_from_json(result, deck_name)
+                    
+                    if not anki_deck_id:
+                        logger.error(f"Failed to sync deck {deck_id} - import returned None")
+                        fail_count += 1
+                        continue
+                    
+                    # Update tracking
+                    new_version = update_info.get('latest_version', 'Unknown')
+                    config.save_downloaded_deck(
+                        deck_id=deck_id,
+                        version=new_version,
+                        anki_deck_id=anki_deck_id,
+                        title=update_info.get('title')
+                    )
+                    
+                    # Clear the update notification (batched below)
+                    updated_ids.append(deck_id)
+                    
+                    logger.info(f"Auto-updated deck {deck_id} to v{new_version}")
+                    success_count += 1
+                    
+                except AnkiPHAPIError as e:
+                    logger.error(f"API error auto-updating deck {deck_id}: {e}")
                     fail_count += 1
                     continue
-                
-                # Import the deck (synchronous for background operation)
-                deck_name = update_info.get('title') or f"Update_{deck_id[:8]}"
-                logger.info(f"Syncing deck {deck_name}...")
-                
-                anki_deck_id = import_deck_from_json(result, deck_name)
-                
-                if not anki_deck_id:
-                    logger.error(f"Failed to sync deck {deck_id} - import returned None")
+                except Exception as e:
+                    logger.exception(f"Failed to auto-update deck {deck_id}: {e}")
                     fail_count += 1
                     continue
-                
-                # Update tracking
-                new_version = update_info.get('latest_version', 'Unknown')
-                config.save_downloaded_deck(
-                    deck_id=deck_id,
-                    version=new_version,
-                    anki_deck_id=anki_deck_id,
-                    title=update_info.get('title')
-                )
-                
-                # Clear the update notification
-                self.clear_update(deck_id)
-                
-                logger.info(f"Auto-updated deck {deck_id} to v{new_version}")
-                success_count += 1
-                
-            except AnkiPHAPIError as e:
-                logger.error(f"API error auto-updating deck {deck_id}: {e}")
-                fail_count += 1
-                continue
-            except Exception as e:
-                logger.exception(f"Failed to auto-update deck {deck_id}: {e}")
-                fail_count += 1
-                continue
+        
+        if updated_ids:
+            config.clear_updates_for_decks(updated_ids)
         
         # Show summary
         if success_count > 0:
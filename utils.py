@@ -3,6 +3,7 @@ Utility functions for the AnkiPH addon
 Version: 1.0.1 - Fixed escaping for Anki search queries
 """
 import re
+from typing import List
 
 
 def escape_anki_search(text: str) -> str:
@@ -90,6 +91,32 @@ def strip_html(text: str) -> str:
     return HTML_TAG_PATTERN.sub('', text)
 
 
+# Record separator used to batch strings through a single regex pass;
+# tags may not span it, so a truncated "<b" can't swallow the next entry
+_BATCH_SEP = '\x1e'
+_BATCH_HTML_TAG_PATTERN = re.compile(r'<[^>\x1e]+>')
+
+
+def strip_html_many(texts: List[str]) -> List[str]:
+    """
+    Strip HTML tags from many strings with one regex sweep.
+    
+    Args:
+        texts: Strings containing HTML tags
+    
+    Returns:
+        Clean strings, in the same order
+    """
+    if not texts:
+        return []
+    joined = _BATCH_SEP.join(texts)
+    result = _BATCH_HTML_TAG_PATTERN.sub('', joined).split(_BATCH_SEP)
+    if len(result) != len(texts):
+        # An input contained the separator itself; strip one by one instead
+        return [strip_html(t) for t in texts]
+    return result
+
+
 class ErrorHandler:
     """
     Unified error handler for AnkiPH.